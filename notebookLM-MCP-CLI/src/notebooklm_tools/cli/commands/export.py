@@ -8,6 +8,7 @@ from rich.console import Console
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.utils._jsonio import dumps
 from notebooklm_tools.services import exports as export_service, ServiceError
 
 console = Console()
@@ -51,8 +52,7 @@ def export_artifact(
             )
         
         if json_output:
-            import json
-            console.print(json.dumps(result, indent=2))
+            console.print(dumps(result, indent=True))
             return
         
         console.print(f"[green]✓[/green] {result['message']}")
@@ -9,6 +9,7 @@ from rich.table import Table
 from notebooklm_tools.core.alias import get_alias_manager
 from notebooklm_tools.core.exceptions import NLMError
 from notebooklm_tools.cli.utils import get_client
+from notebooklm_tools.utils._jsonio import dumps
 from notebooklm_tools.services import notes as notes_service, ServiceError
 
 console = Console()
@@ -38,8 +39,7 @@ def list_notes(
             for note in notes:
                 console.print(note['id'])
         elif json_output:
-            import json
-            console.print(json.dumps(result, indent=2))
+            console.print(dumps(result, indent=True))
         else:
             if not notes:
                 console.print(f"[dim]No notes found in notebook {notebook_id}[/dim]")
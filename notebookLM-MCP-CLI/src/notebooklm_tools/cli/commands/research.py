@@ -112,7 +112,7 @@ def check_status(
     ),
     poll_interval: int = typer.Option(
         30, "--poll-interval",
-        help="Seconds between status checks",
+        help="Maximum seconds between status checks (checks back off from 1s)",
     ),
     max_wait: int = typer.Option(
         300, "--max-wait",
@@ -139,20 +139,15 @@ def check_status(
                 console=console,
             ) as progress:
                 progress.add_task("Waiting for research to complete...", total=None)
-                
-                import time
-                elapsed = 0
+
                 with get_client(profile) as client:
-                    while elapsed < max_wait:
-                        result = research_service.poll_research(
-                            client, notebook_id,
-                            task_id=task_id,
-                            compact=compact,
-                        )
-                        if result["status"] == "completed":
-                            break
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
+                    result = research_service.wait_for_research(
+                        client, notebook_id,
+                        task_id=task_id,
+                        compact=compact,
+                        timeout=max_wait,
+                        max_interval=poll_interval,
+                    )
         else:
             with get_client(profile) as client:
                 result = research_service.poll_research(
@@ -37,8 +37,9 @@ def list_sources(
             if drive:
                 sources = client.get_notebook_sources_with_types(notebook_id)
                 if not skip_freshness:
+                    freshness = client.check_sources_freshness_batch([src['id'] for src in sources])
                     for src in sources:
-                        src['is_fresh'] = client.check_source_freshness(src['id'])
+                        src['is_fresh'] = freshness[src['id']]
             else:
                 sources = client.get_notebook_sources_with_types(notebook_id)
 
@@ -335,10 +336,9 @@ def sync_sources(
             )
 
         with get_client(profile) as client:
-            results = sources_service.sync_drive_sources(client, ids_to_sync)
+            result = sources_service.sync_drive_sources(client, ids_to_sync)
 
-        synced = sum(1 for r in results if r.get("synced"))
-        console.print(f"[green]✓[/green] Synced {synced} source(s)")
+        console.print(f"[green]✓[/green] Synced {result['synced_count']} source(s)")
     except ServiceError as e:
         console.print(f"[red]Error:[/red] {e.user_message}")
         raise typer.Exit(1)
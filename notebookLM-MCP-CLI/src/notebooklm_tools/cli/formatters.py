@@ -1,6 +1,5 @@
 """Output formatting utilities for NLM CLI."""
 
-import json
 import sys
 from enum import Enum
 from typing import Any
@@ -8,6 +7,8 @@ from typing import Any
 from rich.console import Console
 from rich.table import Table
 
+from notebooklm_tools.utils._jsonio import dumps
+
 
 class OutputFormat(str, Enum):
     """Output format options."""
@@ -298,7 +299,7 @@ class JsonFormatter(Formatter):
             if full and created:
                 item["created_at"] = created if isinstance(created, str) else created.isoformat()
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(dumps(data, indent=True))
 
     def format_sources(
         self,
@@ -327,7 +328,7 @@ class JsonFormatter(Formatter):
                 if full:
                     item['is_stale'] = getattr(src, 'is_stale', False)
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(dumps(data, indent=True))
 
     def format_artifacts(
         self,
@@ -357,7 +358,7 @@ class JsonFormatter(Formatter):
                     item['title'] = getattr(art, 'title', '')
                     item['url'] = getattr(art, 'url', '')
             data.append(item)
-        print(json.dumps(data, indent=2))
+        print(dumps(data, indent=True))
 
     def format_item(self, item: Any, title: str = "") -> None:
         if hasattr(item, "model_dump"):
@@ -366,7 +367,7 @@ class JsonFormatter(Formatter):
             data = {k: v for k, v in item.__dict__.items() if not k.startswith("_")}
         else:
             data = {"value": item}
-        print(json.dumps(data, indent=2))
+        print(dumps(data, indent=True))
 
 
 class CompactFormatter(Formatter):
@@ -12,17 +12,31 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+from ..utils import _jsonio
 
 # Use logging instead of print to avoid corrupting MCP stdio protocol
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _read_json(path: Path) -> Any:
+    """Read a JSON file (errors are json.JSONDecodeError)."""
+    return _jsonio.loads(path.read_bytes())
+
+
+def _write_json(path: Path, obj: Any) -> None:
+    """Write obj to path as two-space indented UTF-8 JSON."""
+    path.write_bytes(_jsonio.to_json(obj, indent=True))
+
+
+@dataclass(slots=True)
 class AuthTokens:
     """Authentication tokens for NotebookLM.
 
     Only cookies are required. CSRF token and session ID are optional because
     they can be auto-extracted from the NotebookLM page when needed.
+    Slotted; not frozen, since the client refreshes tokens in place.
     """
     cookies: dict[str, str]
     csrf_token: str = ""  # Optional - auto-extracted from page
@@ -106,9 +120,7 @@ def load_cached_tokens() -> AuthTokens | None:
         return None
 
     try:
-        with open(cache_path) as f:
-            data = json.load(f)
-        tokens = AuthTokens.from_dict(data)
+        tokens = AuthTokens.from_dict(_read_json(cache_path))
 
         # Just warn if tokens are old, but still return them
         # Let the API client's functional check determine validity
@@ -129,8 +141,7 @@ def save_tokens_to_cache(tokens: AuthTokens, silent: bool = False) -> None:
         silent: If True, don't print confirmation message (for auto-updates)
     """
     cache_path = get_cache_path()
-    with open(cache_path, "w") as f:
-        json.dump(tokens.to_dict(), f, indent=2)
+    _write_json(cache_path, tokens.to_dict())
     if not silent:
         logger.info(f"Auth tokens cached to {cache_path}")
 
@@ -279,6 +290,7 @@ class Profile:
             "session_id": self.session_id,
             "email": self.email,
             "last_validated": self.last_validated.isoformat() if self.last_validated else None,
+            "build_label": self.build_label,
         }
 
     @classmethod
@@ -299,6 +311,7 @@ class Profile:
             session_id=data.get("session_id"),
             email=data.get("email"),
             last_validated=last_validated,
+            build_label=data.get("build_label"),
         )
 
 
@@ -341,10 +354,10 @@ class AuthManager:
             raise ProfileNotFoundError(self.profile_name)
         
         try:
-            cookies = json.loads(self.cookies_file.read_text())
+            cookies = _read_json(self.cookies_file)
             metadata = {}
             if self.metadata_file.exists():
-                metadata = json.loads(self.metadata_file.read_text())
+                metadata = _read_json(self.metadata_file)
             
             self._profile = Profile(
                 name=self.profile_name,
@@ -384,7 +397,7 @@ class AuthManager:
         # Guard: check for account mismatch before overwriting
         if not force and email and self.metadata_file.exists():
             try:
-                existing_metadata = json.loads(self.metadata_file.read_text())
+                existing_metadata = _read_json(self.metadata_file)
                 stored_email = existing_metadata.get("email")
                 if stored_email and stored_email != email:
                     raise AccountMismatchError(
@@ -401,18 +414,19 @@ class AuthManager:
         self.profile_dir.chmod(0o700)
         
         # Save cookies
-        self.cookies_file.write_text(json.dumps(cookies, indent=2))
+        _write_json(self.cookies_file, cookies)
         self.cookies_file.chmod(0o600)
         
         # Save metadata
+        now = datetime.now()
         metadata = {
             "csrf_token": csrf_token,
             "session_id": session_id,
             "email": email,
             "build_label": build_label,
-            "last_validated": datetime.now().isoformat(),
+            "last_validated": now.isoformat(),
         }
-        self.metadata_file.write_text(json.dumps(metadata, indent=2))
+        _write_json(self.metadata_file, metadata)
         self.metadata_file.chmod(0o600)
         
         self._profile = Profile(
@@ -421,7 +435,7 @@ class AuthManager:
             csrf_token=csrf_token,
             session_id=session_id,
             email=email,
-            last_validated=datetime.now(),
+            last_validated=now,
             build_label=build_label,
         )
         return self._profile
@@ -8,10 +8,12 @@ operations (notebooks, sources, studio, etc.) are provided by mixin classes.
 Internal API. See CLAUDE.md for full documentation.
 """
 
+import functools
 import json
 import logging
 import os
 import re
+import threading
 import urllib.parse
 from typing import Any
 
@@ -21,6 +23,7 @@ from . import constants
 from .retry import is_retryable_error, DEFAULT_MAX_RETRIES, DEFAULT_BASE_DELAY, DEFAULT_MAX_DELAY
 from .data_types import ConversationTurn
 from .errors import ClientAuthenticationError as AuthenticationError
+from ..utils._jsonio import loads as _loads
 from .utils import (
     RPC_NAMES,
     _format_debug_json,
@@ -36,6 +39,39 @@ logger.setLevel(logging.WARNING)  # Suppress internal API logs by default
 DEFAULT_TIMEOUT = 30.0  # Default for most operations
 SOURCE_ADD_TIMEOUT = 120.0  # Extended timeout for all source operations
 
+# Connection pool for the long-lived RPC client. Keep-alive connections are
+# reused across calls (no TCP/TLS handshake per RPC), and the pool is large
+# enough for the threaded fan-outs in the service layer.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0,
+)
+HTTP_CONNECT_RETRIES = 3  # Retries connection failures only, never a sent request
+
+# Anti-XSSI prefix on every batchexecute response body
+_XSSI_PREFIX = ")]}'"
+
+
+@functools.lru_cache(maxsize=128)
+def _compose_url(
+    base_url: str, rpc_id: str, source_path: str, bl: str, hl: str, session_id: str | None,
+) -> str:
+    """Build a batchexecute URL; cached because a session reuses a few combinations."""
+    params = {
+        "rpcids": rpc_id,
+        "source-path": source_path,
+        "bl": bl,
+        "hl": hl,
+        "rt": "c",
+    }
+
+    if session_id:
+        params["f.sid"] = session_id
+
+    query = urllib.parse.urlencode(params)
+    return f"{base_url}?{query}"
+
 
 class BaseClient:
     """Base client providing HTTP/RPC infrastructure for NotebookLM API.
@@ -251,6 +287,14 @@ class BaseClient:
         self.cookies = cookies
         self.csrf_token = csrf_token
         self._client: httpx.Client | None = None
+        self._upload_client: httpx.Client | None = None
+        # Guards lazy creation and replacement of the pooled clients, which
+        # the service layer shares across worker threads.
+        self._client_lock = threading.Lock()
+        # Clients swapped out by the latest auth recovery, left open so requests
+        # still running on them in other threads can finish. Only one
+        # generation is kept: the next recovery (or close()) closes them.
+        self._retired_clients: list[httpx.Client] = []
         self._session_id = session_id
         self._bl = build_label
 
@@ -274,10 +318,34 @@ class BaseClient:
         self.close()
 
     def close(self):
-        """Close the underlying HTTP client."""
-        if self._client:
-            self._client.close()
+        """Close the underlying HTTP clients."""
+        with self._client_lock:
+            clients = [self._client, self._upload_client, *self._retired_clients]
+            self._client = None
+            self._upload_client = None
+            self._retired_clients = []
+        for client in clients:
+            if client:
+                client.close()
+
+    def _replace_clients(self) -> None:
+        """Drop the pooled clients so the next call builds them from fresh auth.
+
+        The current clients are not closed here, since other threads may
+        still have requests in flight on them; they are kept as the retired
+        generation. The generation retired by the previous recovery is closed
+        now, so repeated refreshes in a long-lived process do not pile up
+        connection pools.
+        """
+        with self._client_lock:
+            stale = self._retired_clients
+            self._retired_clients = [
+                client for client in (self._client, self._upload_client) if client
+            ]
             self._client = None
+            self._upload_client = None
+        for client in stale:
+            client.close()
 
     # =========================================================================
     # Cookie Handling
@@ -329,28 +397,54 @@ class BaseClient:
     # =========================================================================
 
     def _get_client(self) -> httpx.Client:
-        """Get or create HTTP client."""
-        if self._client is None:
-            # Use cookies object directly
-            cookies = self._get_httpx_cookies()
-
-            self._client = httpx.Client(
-                cookies=cookies,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
-                    "Origin": self.BASE_URL,
-                    "Referer": f"{self.BASE_URL}/",
-                    "X-Same-Domain": "1",
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-                },
-                timeout=30.0,
-            )
-            
-            # Explicitly set headers if needed, though constructor handles most
-            if self.csrf_token:
-                self._client.headers["X-Goog-Csrf-Token"] = self.csrf_token
-                
-        return self._client
+        """Get or create the pooled HTTP client shared by all RPCs."""
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                client = httpx.Client(
+                    cookies=self._get_httpx_cookies(),
+                    headers={
+                        "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+                        "Origin": self.BASE_URL,
+                        "Referer": f"{self.BASE_URL}/",
+                        "X-Same-Domain": "1",
+                        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+                    },
+                    timeout=30.0,
+                    transport=httpx.HTTPTransport(
+                        limits=HTTP_POOL_LIMITS,
+                        retries=HTTP_CONNECT_RETRIES,
+                    ),
+                )
+                if self.csrf_token:
+                    client.headers["X-Goog-Csrf-Token"] = self.csrf_token
+                self._client = client
+            return self._client
+
+    def _get_upload_client(self) -> httpx.Client:
+        """Get or create the pooled HTTP client for resumable file uploads.
+
+        Kept separate from the RPC client because uploads go to a different
+        endpoint with their own headers, but it is equally long-lived so a
+        batch of uploads reuses its keep-alive connections. Callers pass a
+        per-request timeout.
+        """
+        client = self._upload_client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._upload_client is None:
+                self._upload_client = httpx.Client(
+                    cookies=self._get_httpx_cookies(),
+                    timeout=DEFAULT_TIMEOUT,
+                    transport=httpx.HTTPTransport(
+                        limits=HTTP_POOL_LIMITS,
+                        retries=HTTP_CONNECT_RETRIES,
+                    ),
+                )
+            return self._upload_client
     
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get an async client for streaming operations."""
@@ -394,19 +488,15 @@ class BaseClient:
 
     def _build_url(self, rpc_id: str, source_path: str = "/") -> str:
         """Build the batchexecute URL with query params."""
-        params = {
-            "rpcids": rpc_id,
-            "source-path": source_path,
-            "bl": os.environ.get("NOTEBOOKLM_BL") or getattr(self, "_bl", "") or self._BL_FALLBACK,
-            "hl": os.environ.get("NOTEBOOKLM_HL", "en"),
-            "rt": "c",
-        }
-
-        if self._session_id:
-            params["f.sid"] = self._session_id
-
-        query = urllib.parse.urlencode(params)
-        return f"{self.BATCHEXECUTE_URL}?{query}"
+        # Env overrides are read on every call; only the encoding is cached.
+        return _compose_url(
+            self.BATCHEXECUTE_URL,
+            rpc_id,
+            source_path,
+            os.environ.get("NOTEBOOKLM_BL") or getattr(self, "_bl", "") or self._BL_FALLBACK,
+            os.environ.get("NOTEBOOKLM_HL", "en"),
+            self._session_id,
+        )
 
     def _parse_response(self, response_text: str) -> Any:
         """Parse the batchexecute response."""
@@ -416,8 +506,7 @@ class BaseClient:
         # <json_array>
 
         # Remove the anti-XSSI prefix
-        if response_text.startswith(")]}'"):
-            response_text = response_text[4:]
+        response_text = response_text.removeprefix(_XSSI_PREFIX)
 
         lines = response_text.strip().split("\n")
 
@@ -438,7 +527,7 @@ class BaseClient:
                 if i < len(lines):
                     json_str = lines[i]
                     try:
-                        data = json.loads(json_str)
+                        data = _loads(json_str)
                         results.append(data)
                     except json.JSONDecodeError:
                         pass
@@ -446,7 +535,7 @@ class BaseClient:
             except ValueError:
                 # Not a byte count, try to parse as JSON
                 try:
-                    data = json.loads(line)
+                    data = _loads(line)
                     results.append(data)
                 except json.JSONDecodeError:
                     pass
@@ -469,7 +558,7 @@ class BaseClient:
                             result_str = item[2]
                             if isinstance(result_str, str):
                                 try:
-                                    return json.loads(result_str)
+                                    return _loads(result_str)
                                 except json.JSONDecodeError:
                                     return result_str
                             return result_str
@@ -588,7 +677,7 @@ class BaseClient:
         if not _retry:
             try:
                 self._refresh_auth_tokens()
-                self._client = None
+                self._replace_clients()
                 return self._call_rpc(rpc_id, params, path, timeout, _retry=True)
             except ValueError:
                 # CSRF refresh failed (cookies expired) - continue to layer 2
@@ -597,7 +686,7 @@ class BaseClient:
         # Layer 2 & 3: Reload from disk or run headless auth (deep retry)
         if not _deep_retry:
             if self._try_reload_or_headless_auth():
-                self._client = None
+                self._replace_clients()
                 return self._call_rpc(rpc_id, params, path, timeout, _retry=True, _deep_retry=True)
         
         # All recovery attempts failed
@@ -125,6 +125,7 @@ class NotebookLMClient(ExportMixin, DownloadMixin, StudioMixin, ResearchMixin, C
     # =========================================================================
     # The following methods are provided by SourceMixin:
     # - check_source_freshness
+    # - check_sources_freshness_batch
     # - sync_drive_source
     # - delete_source
     # - get_notebook_sources_with_types
@@ -165,7 +166,5 @@ class NotebookLMClient(ExportMixin, DownloadMixin, StudioMixin, ResearchMixin, C
     # - delete_note
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client:
-            self._client.close()
-            self._client = None
+        """Close the HTTP clients."""
+        super().close()
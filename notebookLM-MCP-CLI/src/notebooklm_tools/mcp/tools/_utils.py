@@ -1,13 +1,15 @@
 """MCP Tools - Shared utilities and base components."""
 
 import functools
-import json
 import logging
 import os
 from typing import Any
 
+import httpx
+
 from notebooklm_tools.core.client import NotebookLMClient, extract_cookies_from_chrome_export
 from notebooklm_tools.core.auth import load_cached_tokens
+from notebooklm_tools.utils._jsonio import dumps
 
 # MCP request/response logger
 mcp_logger = logging.getLogger("notebooklm_tools.mcp")
@@ -74,6 +76,43 @@ def reset_client() -> None:
     _client = None
 
 
+# Known transport failures mapped to (error_code, message). Their str() is
+# often a long, low-level description, so tools return a short stable message
+# and an error_code the caller can key off instead.
+_KNOWN_ERRORS: dict[type[BaseException], tuple[str, str]] = {
+    httpx.ConnectError: (
+        "network_unavailable",
+        "Could not connect to NotebookLM. Check your network connection.",
+    ),
+    httpx.TimeoutException: (
+        "timeout",
+        "Request to NotebookLM timed out. Try again or increase the timeout.",
+    ),
+    ConnectionError: (
+        "network_unavailable",
+        "Could not connect to NotebookLM. Check your network connection.",
+    ),
+    TimeoutError: (
+        "timeout",
+        "Request to NotebookLM timed out. Try again or increase the timeout.",
+    ),
+}
+
+
+def error_response(e: Exception) -> dict[str, Any]:
+    """Build the error response for an unexpected exception raised by a tool.
+
+    Known network errors (matched on the exception's class hierarchy) get a
+    precomputed message and an error_code; anything else falls back to str(e).
+    """
+    for cls in type(e).__mro__:
+        known = _KNOWN_ERRORS.get(cls)
+        if known is not None:
+            code, message = known
+            return {"status": "error", "error": message, "error_code": code}
+    return {"status": "error", "error": str(e)}
+
+
 def get_mcp_instance():
     """Get the FastMCP instance. Import here to avoid circular imports."""
     from notebooklm_tools.mcp.server import mcp
@@ -94,19 +133,20 @@ def logged_tool():
     """
     def decorator(func):
         is_async = inspect.iscoroutinefunction(func)
+        # Resolved once per tool rather than on every dispatch
+        tool_name = func.__name__
         
         if is_async:
             @functools.wraps(func)
             async def wrapper(*args, **kwargs):
-                tool_name = func.__name__
                 if mcp_logger.isEnabledFor(logging.DEBUG):
                     params = {k: v for k, v in kwargs.items() if v is not None}
-                    mcp_logger.debug(f"MCP Request: {tool_name}({json.dumps(params, default=str)})")
+                    mcp_logger.debug(f"MCP Request: {tool_name}({dumps(params)})")
                 
                 result = await func(*args, **kwargs)
                 
                 if mcp_logger.isEnabledFor(logging.DEBUG):
-                    result_str = json.dumps(result, default=str)
+                    result_str = dumps(result)
                     if len(result_str) > 1000:
                         result_str = result_str[:1000] + "..."
                     mcp_logger.debug(f"MCP Response: {tool_name} -> {result_str}")
@@ -115,15 +155,14 @@ def logged_tool():
         else:
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                tool_name = func.__name__
                 if mcp_logger.isEnabledFor(logging.DEBUG):
                     params = {k: v for k, v in kwargs.items() if v is not None}
-                    mcp_logger.debug(f"MCP Request: {tool_name}({json.dumps(params, default=str)})")
+                    mcp_logger.debug(f"MCP Request: {tool_name}({dumps(params)})")
                 
                 result = func(*args, **kwargs)
                 
                 if mcp_logger.isEnabledFor(logging.DEBUG):
-                    result_str = json.dumps(result, default=str)
+                    result_str = dumps(result)
                     if len(result_str) > 1000:
                         result_str = result_str[:1000] + "..."
                     mcp_logger.debug(f"MCP Response: {tool_name} -> {result_str}")
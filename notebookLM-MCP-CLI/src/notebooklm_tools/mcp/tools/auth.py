@@ -4,7 +4,7 @@ import time
 import urllib.parse
 from typing import Any
 
-from ._utils import get_client, reset_client, logged_tool, ESSENTIAL_COOKIES
+from ._utils import get_client, error_response, reset_client, logged_tool, ESSENTIAL_COOKIES
 
 
 @logged_tool()
@@ -50,7 +50,7 @@ def refresh_auth() -> dict[str, Any]:
             "error": "No cached tokens found. Run 'nlm login' to authenticate.",
         }
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -145,4 +145,4 @@ def save_auth_tokens(
             "extracted_session_id": bool(session_id),
         }
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, get_query_timeout, logged_tool
+from ._utils import get_client, error_response, get_query_timeout, logged_tool
 from ...services import chat as chat_service, ServiceError
 
 
@@ -38,7 +38,7 @@ def notebook_query(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -68,4 +68,4 @@ def chat_configure(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
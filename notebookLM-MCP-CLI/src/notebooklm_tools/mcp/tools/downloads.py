@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import downloads as downloads_service, ServiceError
 
 
@@ -59,4 +59,4 @@ async def download_artifact(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import exports as export_service, ServiceError
 
 
@@ -40,4 +40,4 @@ def export_artifact(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
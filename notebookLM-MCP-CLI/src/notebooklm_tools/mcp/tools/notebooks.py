@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import notebooks as notebooks_service, ServiceError
 
 
@@ -20,7 +20,7 @@ def notebook_list(max_results: int = 100) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -46,7 +46,7 @@ def notebook_get(notebook_id: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -65,7 +65,7 @@ def notebook_describe(notebook_id: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -91,7 +91,7 @@ def notebook_create(title: str = "") -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -109,7 +109,7 @@ def notebook_rename(notebook_id: str, new_title: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -135,4 +135,4 @@ def notebook_delete(notebook_id: str, confirm: bool = False) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
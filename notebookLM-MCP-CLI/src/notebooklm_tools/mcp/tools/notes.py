@@ -1,7 +1,7 @@
 """Notes tools - Note management with consolidated note tool."""
 
 from typing import Any
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import notes as notes_service, ServiceError, ValidationError
 
 
@@ -81,4 +81,4 @@ def note(
     except (ServiceError, ValidationError) as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
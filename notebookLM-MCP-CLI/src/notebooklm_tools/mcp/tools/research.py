@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import research as research_service, ServiceError
 
 
@@ -36,7 +36,7 @@ def research_start(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -72,7 +72,7 @@ def research_status(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -100,4 +100,4 @@ def research_import(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
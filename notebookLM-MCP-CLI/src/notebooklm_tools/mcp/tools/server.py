@@ -10,16 +10,26 @@ from ._utils import logged_tool
 
 def _get_latest_pypi_version() -> str | None:
     """Fetch the latest version from PyPI.
-    
+
+    Uses the PEP 691 JSON simple index, which lists release versions without
+    the README and per-release metadata carried by the legacy JSON API.
+    Pre-releases are ignored so the result matches _compare_versions.
+
     Returns:
         Latest version string or None if fetch fails.
     """
     try:
-        url = "https://pypi.org/pypi/notebooklm-mcp-cli/json"
-        req = urllib.request.Request(url, headers={"User-Agent": "notebooklm-mcp-cli"})
+        url = "https://pypi.org/simple/notebooklm-mcp-cli/"
+        req = urllib.request.Request(url, headers={
+            "User-Agent": "notebooklm-mcp-cli",
+            "Accept": "application/vnd.pypi.simple.v1+json",
+        })
         with urllib.request.urlopen(req, timeout=2) as response:
-            data = json.loads(response.read().decode())
-            return data.get("info", {}).get("version")
+            data = json.loads(response.read())
+        releases = [v for v in data.get("versions", []) if v.replace(".", "").isdigit()]
+        if not releases:
+            return None
+        return max(releases, key=lambda v: [int(x) for x in v.split(".")])
     except Exception:
         return None
 
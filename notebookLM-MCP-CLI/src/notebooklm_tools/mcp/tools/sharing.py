@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import sharing as sharing_service, ServiceError
 
 
@@ -22,7 +22,7 @@ def notebook_share_status(notebook_id: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -45,7 +45,7 @@ def notebook_share_public(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -70,4 +70,4 @@ def notebook_share_invite(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
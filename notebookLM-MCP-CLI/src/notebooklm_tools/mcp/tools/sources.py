@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import sources as sources_service, ServiceError
 
 
@@ -56,7 +56,7 @@ def source_add(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -71,11 +71,11 @@ def source_list_drive(notebook_id: str) -> dict[str, Any]:
     try:
         client = get_client()
         result = sources_service.list_drive_sources(client, notebook_id)
-        return {"status": "success", "notebook_id": notebook_id, **result}
+        return {"status": "success", **result}
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -97,18 +97,12 @@ def source_sync_drive(source_ids: list[str], confirm: bool = False) -> dict[str,
 
     try:
         client = get_client()
-        results = sources_service.sync_drive_sources(client, source_ids)
-        synced_count = sum(1 for r in results if r.get("synced"))
-        return {
-            "status": "success",
-            "synced_count": synced_count,
-            "total_count": len(source_ids),
-            "results": results,
-        }
+        result = sources_service.sync_drive_sources(client, source_ids)
+        return {"status": "success", **result}
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -127,7 +121,7 @@ def source_rename(notebook_id: str, source_id: str, new_title: str) -> dict[str,
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -155,7 +149,7 @@ def source_delete(source_id: str, confirm: bool = False) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -174,7 +168,7 @@ def source_describe(source_id: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -196,4 +190,4 @@ def source_get_content(source_id: str) -> dict[str, Any]:
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
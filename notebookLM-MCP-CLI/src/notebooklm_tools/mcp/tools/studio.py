@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from ._utils import get_client, logged_tool
+from ._utils import get_client, error_response, logged_tool
 from ...services import studio as studio_service, ServiceError, ValidationError
 from ...utils.config import get_default_language
 
@@ -142,7 +142,7 @@ def studio_create(
     except (ValidationError, ServiceError) as e:
         return {"status": "error", "error": e.user_message if isinstance(e, ServiceError) else str(e)}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -202,7 +202,7 @@ def studio_status(
     except (ValidationError, ServiceError) as e:
         return {"status": "error", "error": e.user_message if isinstance(e, ServiceError) else str(e)}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -237,7 +237,7 @@ def studio_delete(
     except ServiceError as e:
         return {"status": "error", "error": e.user_message}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
 
 
 @logged_tool()
@@ -300,4 +300,4 @@ def studio_revise(
     except (ValidationError, ServiceError) as e:
         return {"status": "error", "error": e.user_message if isinstance(e, ServiceError) else str(e)}
     except Exception as e:
-        return {"status": "error", "error": str(e)}
+        return error_response(e)
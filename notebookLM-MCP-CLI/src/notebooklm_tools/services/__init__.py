@@ -2,8 +2,16 @@
 
 This package contains the shared business logic, validation, and error handling
 used by both the CLI and MCP interfaces.
+
+Service submodules are loaded lazily: ``from notebooklm_tools.services import
+notebooks`` binds a module whose code only runs on first attribute access, so
+importing every MCP tool module at startup does not execute every service.
 """
 
+import importlib.util
+import sys
+from types import ModuleType
+
 from .errors import (
     ServiceError,
     ValidationError,
@@ -12,6 +20,38 @@ from .errors import (
     ExportError,
 )
 
+_LAZY_SUBMODULES = frozenset({
+    "chat",
+    "downloads",
+    "exports",
+    "notebooks",
+    "notes",
+    "research",
+    "sharing",
+    "sources",
+    "studio",
+})
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Return a lazily-loaded service submodule (PEP 562)."""
+    if name not in _LAZY_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    fullname = f"{__name__}.{name}"
+    module = sys.modules.get(fullname)
+    if module is None:
+        spec = importlib.util.find_spec(fullname)
+        assert spec is not None and spec.loader is not None
+        loader = importlib.util.LazyLoader(spec.loader)
+        spec.loader = loader
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[fullname] = module
+        loader.exec_module(module)
+    globals()[name] = module
+    return module
+
+
 __all__ = [
     "ServiceError",
     "ValidationError",
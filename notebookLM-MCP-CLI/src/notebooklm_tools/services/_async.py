@@ -0,0 +1,152 @@
+"""Async service variants — awaitable mirrors of the notebook, sharing, research and source services.
+
+The RPC layer (auth refresh, retries, batchexecute parsing) is synchronous.
+Each coroutine here runs the matching sync service function in a worker thread,
+so orchestration code can overlap many calls with ``asyncio.gather`` without
+managing a thread pool itself. Results and errors are identical to the sync
+services.
+"""
+
+import asyncio
+
+from ..core.client import NotebookLMClient
+from . import notebooks as _notebooks
+from . import research as _research
+from . import sharing as _sharing
+from . import sources as _sources
+from .notebooks import NotebookDetailResult, NotebookListResult
+from .research import ResearchImportResult, ResearchStatusResult
+from .sharing import ShareStatusResult
+from .sources import AddSourceResult, DriveListResult, SyncDriveResult
+
+
+async def list_notebooks(
+    client: NotebookLMClient,
+    max_results: int = 100,
+) -> NotebookListResult:
+    """Async variant of :func:`services.notebooks.list_notebooks`."""
+    return await asyncio.to_thread(_notebooks.list_notebooks, client, max_results)
+
+
+async def get_notebook(
+    client: NotebookLMClient,
+    notebook_id: str,
+) -> NotebookDetailResult:
+    """Async variant of :func:`services.notebooks.get_notebook`."""
+    return await asyncio.to_thread(_notebooks.get_notebook, client, notebook_id)
+
+
+async def get_share_status(
+    client: NotebookLMClient,
+    notebook_id: str,
+) -> ShareStatusResult:
+    """Async variant of :func:`services.sharing.get_share_status`."""
+    return await asyncio.to_thread(_sharing.get_share_status, client, notebook_id)
+
+
+async def poll_research(
+    client: NotebookLMClient,
+    notebook_id: str,
+    task_id: str | None = None,
+    query: str | None = None,
+    compact: bool = True,
+) -> ResearchStatusResult:
+    """Async variant of :func:`services.research.poll_research`."""
+    return await asyncio.to_thread(
+        _research.poll_research, client, notebook_id, task_id, query, compact,
+    )
+
+
+async def import_research(
+    client: NotebookLMClient,
+    notebook_id: str,
+    task_id: str,
+    source_indices: list[int] | None = None,
+) -> ResearchImportResult:
+    """Async variant of :func:`services.research.import_research`."""
+    return await asyncio.to_thread(
+        _research.import_research, client, notebook_id, task_id, source_indices,
+    )
+
+
+async def gather_notebooks(
+    client: NotebookLMClient,
+    notebook_ids: list[str],
+) -> list[NotebookDetailResult | BaseException]:
+    """Fetch details for many notebooks concurrently.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_ids: Notebook UUIDs to fetch
+
+    Returns:
+        One entry per ID, in input order: the NotebookDetailResult, or the
+        ServiceError raised for that notebook.
+    """
+    return await asyncio.gather(
+        *(get_notebook(client, nb_id) for nb_id in notebook_ids),
+        return_exceptions=True,
+    )
+
+
+async def gather_share_status(
+    client: NotebookLMClient,
+    notebook_ids: list[str],
+) -> list[ShareStatusResult | BaseException]:
+    """Fetch sharing status for many notebooks concurrently.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_ids: Notebook UUIDs to check
+
+    Returns:
+        One entry per ID, in input order: the ShareStatusResult, or the
+        ServiceError raised for that notebook.
+    """
+    return await asyncio.gather(
+        *(get_share_status(client, nb_id) for nb_id in notebook_ids),
+        return_exceptions=True,
+    )
+
+
+async def add_source(
+    client: NotebookLMClient,
+    notebook_id: str,
+    source_type: str,
+    *,
+    url: str | None = None,
+    text: str | None = None,
+    title: str | None = None,
+    file_path: str | None = None,
+    document_id: str | None = None,
+    doc_type: str = "doc",
+    wait: bool = False,
+    wait_timeout: float = 120.0,
+) -> AddSourceResult:
+    """Async variant of :func:`services.sources.add_source`."""
+    return await asyncio.to_thread(
+        _sources.add_source, client, notebook_id, source_type,
+        url=url, text=text, title=title, file_path=file_path,
+        document_id=document_id, doc_type=doc_type,
+        wait=wait, wait_timeout=wait_timeout,
+    )
+
+
+async def list_drive_sources(
+    client: NotebookLMClient,
+    notebook_id: str,
+) -> DriveListResult:
+    """Async variant of :func:`services.sources.list_drive_sources`."""
+    return await asyncio.to_thread(_sources.list_drive_sources, client, notebook_id)
+
+
+async def sync_drive_sources(
+    client: NotebookLMClient,
+    source_ids: list[str],
+) -> SyncDriveResult:
+    """Async variant of :func:`services.sources.sync_drive_sources`.
+
+    The sync service already fans the sources out over its own thread pool,
+    so one worker thread runs the whole batch.
+    """
+    return await asyncio.to_thread(_sources.sync_drive_sources, client, source_ids)
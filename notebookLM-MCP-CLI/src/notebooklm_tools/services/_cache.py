@@ -0,0 +1,99 @@
+"""Short-lived read cache for idempotent service calls.
+
+Interactive CLI/MCP sessions often repeat the same read within seconds (e.g.
+``get_notebook`` followed by ``get_share_status`` on the same notebook, or a
+retried tool call). Successful results of decorated reads are kept per client
+for ``NOTEBOOKLM_READ_CACHE_TTL`` seconds (default 5, ``0`` disables caching).
+Write operations call :func:`invalidate` so a read never outlives a change made
+through the services.
+"""
+
+import copy
+import functools
+import inspect
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar, cast
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+READ_CACHE_TTL: float = float(os.environ.get("NOTEBOOKLM_READ_CACHE_TTL", "5"))
+READ_CACHE_MAXSIZE = 256
+
+_CacheKey = tuple[str, str]  # (endpoint, notebook_id)
+_CacheEntry = tuple[float, Any]  # (expires_at, result)
+
+_READ_CACHE: "weakref.WeakKeyDictionary[Any, OrderedDict[_CacheKey, _CacheEntry]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def cached_read(endpoint: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Cache a ``func(client, notebook_id)`` service read for READ_CACHE_TTL seconds.
+
+    Only successful results are cached; callers always receive a copy so that
+    in-place changes (such as adding a status envelope) do not leak into the
+    cache.
+    """
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            if READ_CACHE_TTL <= 0:
+                return func(*args, **kwargs)
+
+            if len(args) == 2 and not kwargs:
+                client, notebook_id = args
+            else:
+                client, notebook_id = signature.bind(*args, **kwargs).args
+            key = (endpoint, cast(str, notebook_id))
+            now = time.monotonic()
+            with _lock:
+                entries = _READ_CACHE.get(client)
+                hit = entries.get(key) if entries is not None else None
+            if hit is not None and hit[0] > now:
+                cached: _R = copy.deepcopy(hit[1])
+                return cached
+
+            result = func(*args, **kwargs)
+            _store(client, key, now + READ_CACHE_TTL, copy.deepcopy(result))
+            return result
+
+        return wrapper
+    return decorator
+
+
+def _store(client: Any, key: _CacheKey, expires_at: float, result: Any) -> None:
+    """Insert a cache entry, evicting the oldest beyond READ_CACHE_MAXSIZE."""
+    with _lock:
+        entries = _READ_CACHE.get(client)
+        if entries is None:
+            entries = OrderedDict()
+            try:
+                _READ_CACHE[client] = entries
+            except TypeError:
+                return  # Client is not weak-referenceable; skip caching.
+        entries[key] = (expires_at, result)
+        entries.move_to_end(key)
+        while len(entries) > READ_CACHE_MAXSIZE:
+            entries.popitem(last=False)
+
+
+def invalidate(client: Any, notebook_id: str | None = None) -> None:
+    """Drop cached reads for one notebook, or every notebook when ID is None."""
+    with _lock:
+        entries = _READ_CACHE.get(client)
+        if not entries:
+            return
+        if notebook_id is None:
+            entries.clear()
+            return
+        for key in [k for k in entries if k[1] == notebook_id]:
+            del entries[key]
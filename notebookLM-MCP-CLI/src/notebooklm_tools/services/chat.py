@@ -6,8 +6,16 @@ from ..core.client import NotebookLMClient
 from ..core.conversation import QueryRejectedError
 from .errors import ValidationError, ServiceError
 
-VALID_GOALS = ("default", "learning_guide", "custom")
-VALID_RESPONSE_LENGTHS = ("default", "longer", "shorter")
+# Display order for error messages; membership checks use the frozensets below.
+_VALID_GOALS_DISPLAY = ("default", "learning_guide", "custom")
+_VALID_RESPONSE_LENGTHS_DISPLAY = ("default", "longer", "shorter")
+
+VALID_GOALS = frozenset(_VALID_GOALS_DISPLAY)
+VALID_RESPONSE_LENGTHS = frozenset(_VALID_RESPONSE_LENGTHS_DISPLAY)
+
+_VALID_GOALS_STR = ", ".join(_VALID_GOALS_DISPLAY)
+_VALID_RESPONSE_LENGTHS_STR = ", ".join(_VALID_RESPONSE_LENGTHS_DISPLAY)
+
 MAX_PROMPT_LENGTH = 10_000
 
 
@@ -52,7 +60,7 @@ def query(
         ValidationError: If query is empty
         ServiceError: If the query fails
     """
-    if not query_text or not query_text.strip():
+    if not query_text or query_text.isspace():
         raise ValidationError(
             "Query text is required.",
             user_message="Please provide a question to ask.",
@@ -117,7 +125,7 @@ def configure_chat(
     """
     if goal not in VALID_GOALS:
         raise ValidationError(
-            f"Invalid goal '{goal}'. Must be one of: {', '.join(VALID_GOALS)}",
+            f"Invalid goal '{goal}'. Must be one of: {_VALID_GOALS_STR}",
         )
 
     if goal == "custom" and not custom_prompt:
@@ -134,7 +142,7 @@ def configure_chat(
 
     if response_length not in VALID_RESPONSE_LENGTHS:
         raise ValidationError(
-            f"Invalid response_length '{response_length}'. Must be one of: {', '.join(VALID_RESPONSE_LENGTHS)}",
+            f"Invalid response_length '{response_length}'. Must be one of: {_VALID_RESPONSE_LENGTHS_STR}",
         )
 
     try:
@@ -1,8 +1,12 @@
 """Notebooks service — shared business logic for notebook CRUD and metadata operations."""
 
-from typing import TypedDict, Optional
+import operator
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, TypedDict, Optional
 
 from ..core.client import NotebookLMClient
+from ._cache import cached_read, invalidate
 from .errors import ValidationError, ServiceError, NotFoundError, CreationError
 
 
@@ -18,6 +22,13 @@ class NotebookInfo(TypedDict):
     modified_at: Optional[str]
 
 
+# NotebookInfo keys, in the order they are read off client Notebook objects.
+_NB_KEYS = tuple(NotebookInfo.__annotations__)
+_nb_getter = operator.attrgetter(*_NB_KEYS)
+
+_notebook_url = "https://notebooklm.google.com/notebook/{}".format
+
+
 class NotebookListResult(TypedDict):
     """Result of listing notebooks."""
     notebooks: list[NotebookInfo]
@@ -42,6 +53,19 @@ class NotebookDetailResult(TypedDict):
     sources: list[SourceInfo]
 
 
+class NotebookDetailError(TypedDict):
+    """A notebook whose details could not be fetched."""
+    notebook_id: str
+    error: str
+
+
+class NotebookDetailsListResult(TypedDict):
+    """Result of listing notebooks together with their details."""
+    notebooks: list[NotebookDetailResult]
+    errors: list[NotebookDetailError]
+    count: int
+
+
 class NotebookSummaryResult(TypedDict):
     """Result of AI-generated notebook summary."""
     summary: str
@@ -71,12 +95,16 @@ class NotebookDeleteResult(TypedDict):
 def list_notebooks(
     client: NotebookLMClient,
     max_results: int = 100,
+    count_all: bool = True,
 ) -> NotebookListResult:
     """List all notebooks.
 
     Args:
         client: Authenticated NotebookLM client
         max_results: Maximum notebooks to return
+        count_all: Compute owned/shared counts over every notebook. When False,
+            only the first ``max_results`` are scanned and the counts describe
+            the returned rows (``count`` is still the overall total).
 
     Returns:
         NotebookListResult with notebooks and counts
@@ -89,31 +117,28 @@ def list_notebooks(
     except Exception as e:
         raise ServiceError(f"Failed to list notebooks: {e}")
 
-    owned_count = sum(1 for nb in notebooks if nb.is_owned)
-    shared_count = len(notebooks) - owned_count
-    shared_by_me_count = sum(1 for nb in notebooks if nb.is_owned and nb.is_shared)
+    # Count ownership and build the (truncated) output in one pass.
+    owned_count = shared_by_me_count = 0
+    out: list[NotebookInfo] = []
+    scanned = notebooks if count_all else notebooks[:max_results]
+    for i, nb in enumerate(scanned):
+        if nb.is_owned:
+            owned_count += 1
+            if nb.is_shared:
+                shared_by_me_count += 1
+        if i < max_results:
+            out.append(dict(zip(_NB_KEYS, _nb_getter(nb))))
 
     return {
-        "notebooks": [
-            {
-                "id": nb.id,
-                "title": nb.title,
-                "source_count": nb.source_count,
-                "url": nb.url,
-                "ownership": nb.ownership,
-                "is_shared": nb.is_shared,
-                "created_at": nb.created_at,
-                "modified_at": nb.modified_at,
-            }
-            for nb in notebooks[:max_results]
-        ],
+        "notebooks": out,
         "count": len(notebooks),
         "owned_count": owned_count,
-        "shared_count": shared_count,
+        "shared_count": len(scanned) - owned_count,
         "shared_by_me_count": shared_by_me_count,
     }
 
 
+@cached_read("get_notebook")
 def get_notebook(
     client: NotebookLMClient,
     notebook_id: str,
@@ -121,7 +146,8 @@ def get_notebook(
     """Get notebook details including source list.
 
     Handles raw RPC list responses from the API, normalising them into a
-    clean typed dict.
+    clean typed dict. The normaliser for the client's payload shape is
+    detected once and cached per client.
 
     Args:
         client: Authenticated NotebookLM client
@@ -145,47 +171,131 @@ def get_notebook(
             user_message=f"Notebook {notebook_id} not found.",
         )
 
-    # The client may return raw RPC data (nested list) instead of a Notebook object.
-    # Normalise that into a consistent result.
+    normalizer = _NORMALIZERS.get(client)
+    if normalizer is not None:
+        try:
+            return normalizer(nb, notebook_id)
+        except (TypeError, AttributeError, IndexError):
+            pass  # Payload shape changed; probe again below.
+
+    normalizer = _probe_normalizer(nb)
+    if normalizer is None:
+        raise ServiceError(
+            f"Unexpected notebook data format: {str(nb)[:200]}",
+            user_message="Received unexpected data format from the API.",
+        )
+    try:
+        _NORMALIZERS[client] = normalizer
+    except TypeError:
+        pass  # Client is not weak-referenceable; just skip caching.
+    return normalizer(nb, notebook_id)
+
+
+# Turns a client.get_notebook payload into a NotebookDetailResult.
+_Normalizer = Callable[[Any, str], NotebookDetailResult]
+
+
+def _normalize_rpc_list(nb: list[Any], notebook_id: str) -> NotebookDetailResult:
+    """Normalise a raw RPC notebook payload (nested list)."""
+    data = nb[0] if isinstance(nb[0], list) else nb
+    title = data[0] if isinstance(data[0], str) else "Untitled"
+    sources_data = data[1] if isinstance(data[1], list) else []
+    nb_id = data[2]
+
+    sources: list[SourceInfo] = []
+    for src in sources_data:
+        if isinstance(src, list) and len(src) >= 2:
+            src_id = src[0][0] if isinstance(src[0], list) and src[0] else src[0]
+            sources.append({"id": src_id, "title": src[1]})
+
+    return {
+        "notebook_id": nb_id,
+        "title": title,
+        "source_count": len(sources),
+        "url": _notebook_url(nb_id),
+        "sources": sources,
+    }
+
+
+def _normalize_object(nb: Any, notebook_id: str) -> NotebookDetailResult:
+    """Normalise a dataclass-like Notebook object (e.g. from list_notebooks)."""
+    nb_id = nb.id
+    url = getattr(nb, "url", None)
+    return {
+        "notebook_id": nb_id,
+        "title": getattr(nb, "title", "Untitled"),
+        "source_count": getattr(nb, "source_count", 0),
+        "url": _notebook_url(nb_id) if url is None else url,
+        "sources": [],
+    }
+
+
+def _probe_normalizer(nb: Any) -> _Normalizer | None:
+    """Pick the normaliser matching the payload shape, or None if unknown."""
     if isinstance(nb, list):
         data = nb[0] if nb and isinstance(nb[0], list) else nb
         if isinstance(data, list) and len(data) >= 3:
-            title = data[0] if isinstance(data[0], str) else "Untitled"
-            sources_data = data[1] if len(data) > 1 and isinstance(data[1], list) else []
-            nb_id = data[2] if len(data) > 2 else notebook_id
-
-            sources: list[SourceInfo] = []
-            for src in sources_data:
-                if isinstance(src, list) and len(src) >= 2:
-                    src_id = src[0][0] if isinstance(src[0], list) and src[0] else src[0]
-                    src_title = src[1] if len(src) > 1 else "Untitled"
-                    sources.append({"id": src_id, "title": src_title})
-
-            return {
-                "notebook_id": nb_id,
-                "title": title,
-                "source_count": len(sources),
-                "url": f"https://notebooklm.google.com/notebook/{nb_id}",
-                "sources": sources,
-            }
-
-    # Fallback: if nb is a dataclass-like object with attrs (e.g. from list_notebooks)
+            return _normalize_rpc_list
     if hasattr(nb, "id"):
-        return {
-            "notebook_id": nb.id,
-            "title": getattr(nb, "title", "Untitled"),
-            "source_count": getattr(nb, "source_count", 0),
-            "url": getattr(nb, "url", f"https://notebooklm.google.com/notebook/{nb.id}"),
-            "sources": [],
-        }
+        return _normalize_object
+    return None
 
-    # Last-resort fallback
-    raise ServiceError(
-        f"Unexpected notebook data format: {str(nb)[:200]}",
-        user_message="Received unexpected data format from the API.",
-    )
+
+# A client returns one payload shape consistently, so the normaliser chosen by
+# the first get_notebook call is reused for later calls on the same client.
+_NORMALIZERS: "weakref.WeakKeyDictionary[NotebookLMClient, _Normalizer]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def list_notebooks_with_details(
+    client: NotebookLMClient,
+    max_results: int = 100,
+    workers: int = 10,
+) -> NotebookDetailsListResult:
+    """List notebooks and fetch each one's details concurrently.
+
+    Each get_notebook call is an independent, I/O-bound RPC, so they are
+    issued from a thread pool over the client's shared keep-alive connection
+    pool (HTTP_POOL_LIMITS in core.base must allow at least ``workers``
+    connections). A failure for one notebook is recorded in ``errors`` and
+    does not abort the batch.
+
+    Args:
+        client: Authenticated NotebookLM client
+        max_results: Maximum notebooks to fetch details for
+        workers: Maximum concurrent detail requests
+
+    Returns:
+        NotebookDetailsListResult with details in listing order
+
+    Raises:
+        ServiceError: If listing fails
+    """
+    listed = list_notebooks(client, max_results)
+    ids = [nb["id"] for nb in listed["notebooks"]]
+
+    details: dict[str, NotebookDetailResult] = {}
+    errors: list[NotebookDetailError] = []
+    if ids:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(ids)))) as executor:
+            futures = {executor.submit(get_notebook, client, nb_id): nb_id for nb_id in ids}
+            for future in as_completed(futures):
+                nb_id = futures[future]
+                try:
+                    details[nb_id] = future.result()
+                except ServiceError as e:
+                    errors.append({"notebook_id": nb_id, "error": e.user_message})
+
+    notebooks = [details[nb_id] for nb_id in ids if nb_id in details]
+    return {
+        "notebooks": notebooks,
+        "errors": errors,
+        "count": len(notebooks),
+    }
 
 
+@cached_read("describe_notebook")
 def describe_notebook(
     client: NotebookLMClient,
     notebook_id: str,
@@ -281,6 +391,7 @@ def rename_notebook(
 
     try:
         result = client.rename_notebook(notebook_id, new_title)
+        invalidate(client, notebook_id)
     except Exception as e:
         raise ServiceError(f"Failed to rename notebook: {e}")
 
@@ -315,6 +426,7 @@ def delete_notebook(
     """
     try:
         result = client.delete_notebook(notebook_id)
+        invalidate(client, notebook_id)
     except Exception as e:
         raise ServiceError(f"Failed to delete notebook: {e}")
 
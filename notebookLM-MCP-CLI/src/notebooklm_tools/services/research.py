@@ -1,13 +1,20 @@
 """Research service — shared business logic for research start, poll, and import."""
 
+import random
+import time
+from itertools import islice
 from typing import TypedDict, Optional, Literal
 
 from ..core.client import NotebookLMClient
+from ._cache import invalidate
 from .errors import ValidationError, ServiceError
 
 VALID_SOURCES = ("web", "drive")
 VALID_MODES = ("fast", "deep")
 
+# Poll statuses after which waiting longer cannot change the outcome.
+_TERMINAL_STATUSES = frozenset({"completed", "no_research"})
+
 
 class ResearchStartResult(TypedDict):
     """Result of starting a research task."""
@@ -151,29 +158,74 @@ def poll_research(
             "message": None,
         }
 
-    sources = result.get("sources", [])
-    report = result.get("report", "")
+    # sources_found always counts every discovered source, even when the
+    # compact view below only carries the first few.
+    all_sources = result.get("sources") or []
+    sources_found = len(all_sources)
+    sources = all_sources
+    report = result.get("report") or ""
 
     if compact:
         if len(report) > 500:
             report = report[:500] + "...[truncated]"
-        if len(sources) > 5:
-            total = len(sources)
-            sources = sources[:5]
-            sources.append({"note": f"...and {total - 5} more sources"})
+        if sources_found > 5:
+            sources = [*islice(sources, 5), {"note": f"...and {sources_found - 5} more sources"}]
 
     status = result.get("status", "unknown")
     return {
         "status": status,
         "notebook_id": notebook_id,
         "task_id": result.get("task_id"),
-        "sources_found": len(result.get("sources", [])),
+        "sources_found": sources_found,
         "sources": sources,
         "report": report,
         "message": "Use research_import to add sources to notebook." if status == "completed" else None,
     }
 
 
+def wait_for_research(
+    client: NotebookLMClient,
+    notebook_id: str,
+    task_id: Optional[str] = None,
+    *,
+    query: Optional[str] = None,
+    compact: bool = True,
+    timeout: float = 600.0,
+    max_interval: float = 15.0,
+) -> ResearchStatusResult:
+    """Poll research until it finishes, backing off between checks.
+
+    Waits 1s, 2s, 4s, ... (plus up to 10% jitter) between polls, capped at
+    max_interval, so fast research is picked up quickly while deep research
+    costs only a handful of requests.
+
+    Args:
+        client: Authenticated NotebookLM client
+        notebook_id: Notebook UUID
+        task_id: Specific task ID to poll
+        query: Query text for fallback matching
+        compact: Truncate report and limit sources
+        timeout: Max seconds to wait
+        max_interval: Upper bound on the delay between polls
+
+    Returns:
+        The last ResearchStatusResult. Its status is still "in_progress" if
+        the timeout elapsed first.
+
+    Raises:
+        ServiceError: If a poll fails
+    """
+    deadline = time.monotonic() + timeout
+    delay = 1.0
+    while True:
+        result = poll_research(client, notebook_id, task_id=task_id, query=query, compact=compact)
+        remaining = deadline - time.monotonic()
+        if result["status"] in _TERMINAL_STATUSES or remaining <= 0:
+            return result
+        time.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+        delay = min(delay * 2, max_interval)
+
+
 def import_research(
     client: NotebookLMClient,
     notebook_id: str,
@@ -186,7 +238,8 @@ def import_research(
         client: Authenticated NotebookLM client
         notebook_id: Notebook UUID
         task_id: Research task ID
-        source_indices: Indices of sources to import (default: all)
+        source_indices: Indices of sources to import (default: all).
+            Out-of-range indices are ignored and duplicates imported once.
 
     Returns:
         ResearchImportResult
@@ -215,13 +268,11 @@ def import_research(
             user_message="No sources were found in the research results.",
         )
 
-    # Filter by indices if provided
+    # Filter by indices if provided (deduplicated, in index order)
     if source_indices is not None:
-        sources_to_import = [
-            all_sources[idx]
-            for idx in source_indices
-            if 0 <= idx < len(all_sources)
-        ]
+        n = len(all_sources)
+        wanted = sorted({idx for idx in source_indices if 0 <= idx < n})
+        sources_to_import = [all_sources[idx] for idx in wanted]
     else:
         sources_to_import = all_sources
 
@@ -237,6 +288,7 @@ def import_research(
             task_id=task_id,
             sources=sources_to_import,
         )
+        invalidate(client, notebook_id)
     except Exception as e:
         raise ServiceError(f"Failed to import sources: {e}")
 
@@ -1,11 +1,18 @@
 """Sharing service — shared business logic for notebook sharing and collaboration."""
 
+import re
 from typing import TypedDict, Literal, Optional
 
 from ..core.client import NotebookLMClient
 from ..core.data_types import ShareStatus, Collaborator
+from ._cache import cached_read, invalidate
 from .errors import ValidationError, ServiceError
 
+_ROLES = frozenset({"viewer", "editor"})
+
+# Deliberately loose: catches obvious typos locally instead of paying an RPC.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class CollaboratorInfo(TypedDict):
     """Collaborator details."""
@@ -51,6 +58,7 @@ def _collaborator_to_dict(c: Collaborator) -> CollaboratorInfo:
     }
 
 
+@cached_read("get_share_status")
 def get_share_status(client: NotebookLMClient, notebook_id: str) -> ShareStatusResult:
     """Get sharing status and collaborators for a notebook.
 
@@ -66,7 +74,7 @@ def get_share_status(client: NotebookLMClient, notebook_id: str) -> ShareStatusR
     """
     try:
         status: ShareStatus = client.get_share_status(notebook_id)
-        collaborators = [_collaborator_to_dict(c) for c in status.collaborators]
+        collaborators = list(map(_collaborator_to_dict, status.collaborators))
         return {
             "notebook_id": notebook_id,
             "is_public": status.is_public,
@@ -99,6 +107,7 @@ def set_public_access(
     """
     try:
         result = client.set_public_access(notebook_id, is_public)
+        invalidate(client, notebook_id)
         if is_public:
             return {
                 "notebook_id": notebook_id,
@@ -135,11 +144,17 @@ def invite_collaborator(
         InviteResult with invitation details
 
     Raises:
-        ValidationError: If role is invalid
+        ValidationError: If email or role is invalid
         ServiceError: If invitation fails
     """
+    if not _EMAIL_RE.match(email):
+        raise ValidationError(
+            f"Invalid email '{email}'.",
+            user_message=f"'{email}' is not a valid email address.",
+        )
+
     clean_role = role.lower()
-    if clean_role not in ("viewer", "editor"):
+    if clean_role not in _ROLES:
         raise ValidationError(
             f"Invalid role '{role}'. Must be 'viewer' or 'editor'.",
             user_message=f"Role must be 'viewer' or 'editor' (got '{role}')",
@@ -147,6 +162,7 @@ def invite_collaborator(
 
     try:
         result = client.add_collaborator(notebook_id, email, clean_role)
+        invalidate(client, notebook_id)
         if result:
             return {
                 "notebook_id": notebook_id,
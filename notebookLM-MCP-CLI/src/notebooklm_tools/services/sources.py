@@ -1,20 +1,34 @@
 """Sources service — shared validation and logic for source management."""
 
-from typing import TypedDict, Optional
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import PurePath
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import Any, Optional, ParamSpec, TypedDict, TypeVar
 
 from ..core.client import NotebookLMClient
+from ._cache import invalidate
 from .errors import ValidationError, ServiceError
 
-VALID_SOURCE_TYPES = ("url", "text", "drive", "file")
+# Display order for error messages; membership checks use the frozenset.
+_VALID_SOURCE_TYPES_DISPLAY = ("url", "text", "drive", "file")
+VALID_SOURCE_TYPES = frozenset(_VALID_SOURCE_TYPES_DISPLAY)
+_VALID_SOURCE_TYPES_STR = ", ".join(_VALID_SOURCE_TYPES_DISPLAY)
 VALID_DRIVE_DOC_TYPES = ("doc", "slides", "sheets", "pdf")
 
-# MIME type mapping for Drive doc types
-DRIVE_MIME_TYPES = {
+# Upper bound on concurrent Drive sync requests (each is an independent RPC).
+SYNC_MAX_WORKERS = 8
+
+# MIME type mapping for Drive doc types (read-only)
+DRIVE_MIME_TYPES = MappingProxyType({
     "doc": "application/vnd.google-apps.document",
     "slides": "application/vnd.google-apps.presentation",
     "sheets": "application/vnd.google-apps.spreadsheet",
     "pdf": "application/pdf",
-}
+})
+_DEFAULT_DRIVE_MIME = DRIVE_MIME_TYPES["doc"]
 
 
 class AddSourceResult(TypedDict):
@@ -40,6 +54,13 @@ class SyncResult(TypedDict):
     error: Optional[str]
 
 
+class SyncDriveResult(TypedDict):
+    """Summary of a Drive sync batch."""
+    synced_count: int
+    total_count: int
+    results: list[SyncResult]
+
+
 class SourceContentResult(TypedDict):
     """Result of getting source content."""
     content: str
@@ -62,18 +83,51 @@ class DescribeResult(TypedDict):
 
 class DriveListResult(TypedDict):
     """Result of listing Drive sources."""
+    notebook_id: str
     drive_sources: list[DriveSourceInfo]
     other_sources: list[dict]
     drive_count: int
     stale_count: int
 
 
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _wrap_errors(op: str, user_msg: str) -> Callable[[Callable[_P, _R]], Callable[_P, _R]]:
+    """Translate unexpected exceptions from a service call into ServiceError.
+
+    ServiceErrors (including ValidationError) propagate unchanged; anything
+    else becomes ``ServiceError(f"Failed to {op}: {e}", user_message=user_msg)``.
+    Both strings may use ``{name}`` placeholders for the call's arguments,
+    e.g. ``"rename source {source_id}"``.
+    """
+    def decorator(func: Callable[_P, _R]) -> Callable[_P, _R]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            try:
+                return func(*args, **kwargs)
+            except ServiceError:
+                raise
+            except Exception as e:
+                call_args = signature.bind(*args, **kwargs).arguments
+                raise ServiceError(
+                    f"Failed to {op.format_map(call_args)}: {e}",
+                    user_message=user_msg.format_map(call_args),
+                ) from e
+
+        return wrapper
+    return decorator
+
+
 def validate_source_type(source_type: str) -> None:
     """Validate source type. Raises ValidationError if invalid."""
     if source_type not in VALID_SOURCE_TYPES:
         raise ValidationError(
             f"Unknown source type '{source_type}'. "
-            f"Valid types: {', '.join(VALID_SOURCE_TYPES)}",
+            f"Valid types: {_VALID_SOURCE_TYPES_STR}",
         )
 
 
@@ -82,9 +136,10 @@ def resolve_drive_mime_type(doc_type: str) -> str:
 
     Returns the MIME type string, falling back to Google Doc MIME type.
     """
-    return DRIVE_MIME_TYPES.get(doc_type, DRIVE_MIME_TYPES["doc"])
+    return DRIVE_MIME_TYPES.get(doc_type, _DEFAULT_DRIVE_MIME)
 
 
+@_wrap_errors("add {source_type} source", "Could not add {source_type} source.")
 def add_source(
     client: NotebookLMClient,
     notebook_id: str,
@@ -126,50 +181,78 @@ def add_source(
     validate_source_type(source_type)
 
     try:
-        if source_type == "url":
-            if not url:
-                raise ValidationError("url is required for source_type='url'")
-            result = client.add_url_source(notebook_id, url, wait=wait, wait_timeout=wait_timeout)
-            return _extract_result(result, "url", url)
-
-        elif source_type == "text":
-            if not text:
-                raise ValidationError("text is required for source_type='text'")
-            effective_title = title or "Pasted Text"
-            result = client.add_text_source(
-                notebook_id, text, effective_title,
-                wait=wait, wait_timeout=wait_timeout,
-            )
-            return _extract_result(result, "text", effective_title)
-
-        elif source_type == "drive":
-            if not document_id:
-                raise ValidationError("document_id is required for source_type='drive'")
-            effective_title = title or "Drive Document"
-            mime_type = resolve_drive_mime_type(doc_type)
-            result = client.add_drive_source(
-                notebook_id, document_id, effective_title, mime_type,
-                wait=wait, wait_timeout=wait_timeout,
-            )
-            return _extract_result(result, "drive", effective_title)
-
-        elif source_type == "file":
-            if not file_path:
-                raise ValidationError("file_path is required for source_type='file'")
-            result = client.add_file(notebook_id, file_path, wait=wait, wait_timeout=wait_timeout)
-            fallback_title = str(file_path).split("/")[-1]
-            return _extract_result(result, "file", fallback_title)
-
-    except (ValidationError, ServiceError):
-        raise
-    except Exception as e:
-        raise ServiceError(
-            f"Failed to add {source_type} source: {e}",
-            user_message=f"Could not add {source_type} source.",
+        return _ADD_HANDLERS[source_type](
+            client, notebook_id,
+            url=url, text=text, title=title, file_path=file_path,
+            document_id=document_id, doc_type=doc_type,
+            wait=wait, wait_timeout=wait_timeout,
         )
+    finally:
+        invalidate(client, notebook_id)
+
+
+def _add_url(
+    client: NotebookLMClient, notebook_id: str, *,
+    url: str | None, wait: bool, wait_timeout: float, **_: Any,
+) -> AddSourceResult:
+    """Add a URL/YouTube source."""
+    if not url:
+        raise ValidationError("url is required for source_type='url'")
+    result = client.add_url_source(notebook_id, url, wait=wait, wait_timeout=wait_timeout)
+    return _extract_result(result, "url", url)
 
-    # Should never reach here due to validate_source_type above
-    raise ServiceError(f"Unexpected source type: {source_type}")
+
+def _add_text(
+    client: NotebookLMClient, notebook_id: str, *,
+    text: str | None, title: str | None, wait: bool, wait_timeout: float, **_: Any,
+) -> AddSourceResult:
+    """Add a pasted-text source."""
+    if not text:
+        raise ValidationError("text is required for source_type='text'")
+    effective_title = title or "Pasted Text"
+    result = client.add_text_source(
+        notebook_id, text, effective_title,
+        wait=wait, wait_timeout=wait_timeout,
+    )
+    return _extract_result(result, "text", effective_title)
+
+
+def _add_drive(
+    client: NotebookLMClient, notebook_id: str, *,
+    document_id: str | None, title: str | None, doc_type: str,
+    wait: bool, wait_timeout: float, **_: Any,
+) -> AddSourceResult:
+    """Add a Google Drive document source."""
+    if not document_id:
+        raise ValidationError("document_id is required for source_type='drive'")
+    effective_title = title or "Drive Document"
+    mime_type = resolve_drive_mime_type(doc_type)
+    result = client.add_drive_source(
+        notebook_id, document_id, effective_title, mime_type,
+        wait=wait, wait_timeout=wait_timeout,
+    )
+    return _extract_result(result, "drive", effective_title)
+
+
+def _add_file(
+    client: NotebookLMClient, notebook_id: str, *,
+    file_path: str | None, wait: bool, wait_timeout: float, **_: Any,
+) -> AddSourceResult:
+    """Upload a local file source."""
+    if not file_path:
+        raise ValidationError("file_path is required for source_type='file'")
+    result = client.add_file(notebook_id, file_path, wait=wait, wait_timeout=wait_timeout)
+    fallback_title = PurePath(file_path).name or str(file_path)
+    return _extract_result(result, "file", fallback_title)
+
+
+# One handler per entry in VALID_SOURCE_TYPES
+_ADD_HANDLERS: dict[str, Callable[..., AddSourceResult]] = {
+    "url": _add_url,
+    "text": _add_text,
+    "drive": _add_drive,
+    "file": _add_file,
+}
 
 
 def _extract_result(
@@ -212,44 +295,57 @@ def list_drive_sources(
             user_message="Could not list notebook sources.",
         )
 
+    # Collect syncable IDs first so freshness is fetched in one batch call.
+    sync_ids = [source["id"] for source in sources if source.get("can_sync")]
+    freshness = client.check_sources_freshness_batch(sync_ids) if sync_ids else {}
+
     drive_sources: list[DriveSourceInfo] = []
     other_sources: list[dict] = []
+    stale_count = 0
 
     for source in sources:
-        source_info: dict = {
-            "id": source.get("id"),
-            "title": source.get("title"),
-            "type": source.get("source_type_name"),
-        }
-
         if source.get("can_sync"):
-            is_fresh = client.check_source_freshness(source["id"])
-            source_info["stale"] = not is_fresh if is_fresh is not None else None
-            source_info["drive_doc_id"] = source.get("drive_doc_id")
-            drive_sources.append(source_info)
+            is_fresh = freshness.get(source["id"])
+            stale = None if is_fresh is None else not is_fresh
+            stale_count += stale is True
+            drive_sources.append({
+                "id": source.get("id"),
+                "title": source.get("title"),
+                "type": source.get("source_type_name"),
+                "stale": stale,
+                "drive_doc_id": source.get("drive_doc_id"),
+            })
         else:
-            other_sources.append(source_info)
+            other_sources.append({
+                "id": source.get("id"),
+                "title": source.get("title"),
+                "type": source.get("source_type_name"),
+            })
 
     return {
+        "notebook_id": notebook_id,
         "drive_sources": drive_sources,
         "other_sources": other_sources,
         "drive_count": len(drive_sources),
-        "stale_count": sum(1 for s in drive_sources if s.get("stale")),
+        "stale_count": stale_count,
     }
 
 
 def sync_drive_sources(
     client: NotebookLMClient,
     source_ids: list[str],
-) -> list[SyncResult]:
+) -> SyncDriveResult:
     """Sync Drive sources with latest content.
 
+    Sources are synced concurrently (up to SYNC_MAX_WORKERS at a time);
+    results are returned in the order of ``source_ids``.
+
     Args:
         client: Authenticated NotebookLM client
         source_ids: Source UUIDs to sync
 
     Returns:
-        List of SyncResult per source
+        SyncDriveResult with per-source results and synced/total counts
 
     Raises:
         ServiceError: If the sync operation fails entirely
@@ -258,16 +354,28 @@ def sync_drive_sources(
         raise ValidationError("No source IDs provided for sync.")
 
     results: list[SyncResult] = []
-    for source_id in source_ids:
-        try:
-            result = client.sync_drive_source(source_id)
-            results.append({"source_id": source_id, "synced": bool(result), "error": None})
-        except Exception as e:
-            results.append({"source_id": source_id, "synced": False, "error": str(e)})
+    synced_count = 0
+    sync = client.sync_drive_source
+    with ThreadPoolExecutor(max_workers=min(SYNC_MAX_WORKERS, len(source_ids))) as executor:
+        futures = [executor.submit(sync, source_id) for source_id in source_ids]
+        # Read back in input order; the whole batch finishes before returning anyway
+        for source_id, future in zip(source_ids, futures, strict=True):
+            try:
+                result = future.result()
+                results.append({"source_id": source_id, "synced": bool(result), "error": None})
+                if result:
+                    synced_count += 1
+            except Exception as e:
+                results.append({"source_id": source_id, "synced": False, "error": str(e)})
 
-    return results
+    return {
+        "synced_count": synced_count,
+        "total_count": len(source_ids),
+        "results": results,
+    }
 
 
+@_wrap_errors("rename source {source_id}", "Failed to rename source.")
 def rename_source(
     client: NotebookLMClient,
     notebook_id: str,
@@ -289,29 +397,24 @@ def rename_source(
         ValidationError: If new_title is empty
         ServiceError: If rename fails
     """
-    if not new_title or not new_title.strip():
+    stripped = new_title.strip() if new_title else ""
+    if not stripped:
         raise ValidationError("new_title cannot be empty.")
 
-    try:
-        result = client.rename_source(notebook_id, source_id, new_title.strip())
-        if not result:
-            raise ServiceError(
-                f"Rename returned no data for source {source_id}",
-                user_message="Failed to rename source.",
-            )
-        return {
-            "source_id": result["id"],
-            "title": result["title"],
-        }
-    except (ValidationError, ServiceError):
-        raise
-    except Exception as e:
+    result = client.rename_source(notebook_id, source_id, stripped)
+    invalidate(client, notebook_id)
+    if not result:
         raise ServiceError(
-            f"Failed to rename source {source_id}: {e}",
+            f"Rename returned no data for source {source_id}",
             user_message="Failed to rename source.",
         )
+    return {
+        "source_id": result["id"],
+        "title": result["title"],
+    }
 
 
+@_wrap_errors("delete source {source_id}", "Failed to delete source.")
 def delete_source(
     client: NotebookLMClient,
     source_id: str,
@@ -325,22 +428,16 @@ def delete_source(
     Raises:
         ServiceError: If deletion fails
     """
-    try:
-        result = client.delete_source(source_id)
-        if not result:
-            raise ServiceError(
-                f"Delete returned falsy for source {source_id}",
-                user_message="Failed to delete source.",
-            )
-    except ServiceError:
-        raise
-    except Exception as e:
+    result = client.delete_source(source_id)
+    invalidate(client)  # Owning notebook is unknown here
+    if not result:
         raise ServiceError(
-            f"Failed to delete source {source_id}: {e}",
+            f"Delete returned falsy for source {source_id}",
             user_message="Failed to delete source.",
         )
 
 
+@_wrap_errors("describe source {source_id}", "Failed to get source summary.")
 def describe_source(
     client: NotebookLMClient,
     source_id: str,
@@ -357,26 +454,19 @@ def describe_source(
     Raises:
         ServiceError: If describe fails
     """
-    try:
-        result = client.get_source_guide(source_id)
-        if not result:
-            raise ServiceError(
-                f"No description returned for source {source_id}",
-                user_message="Failed to get source summary.",
-            )
-        return {
-            "summary": result.get("summary", ""),
-            "keywords": result.get("keywords", []),
-        }
-    except ServiceError:
-        raise
-    except Exception as e:
+    result = client.get_source_guide(source_id)
+    if not result:
         raise ServiceError(
-            f"Failed to describe source {source_id}: {e}",
+            f"No description returned for source {source_id}",
             user_message="Failed to get source summary.",
         )
+    return {
+        "summary": result.get("summary", ""),
+        "keywords": result.get("keywords", []),
+    }
 
 
+@_wrap_errors("get content for source {source_id}", "Failed to get source content.")
 def get_source_content(
     client: NotebookLMClient,
     source_id: str,
@@ -393,24 +483,17 @@ def get_source_content(
     Raises:
         ServiceError: If content retrieval fails
     """
-    try:
-        result = client.get_source_fulltext(source_id)
-        if not result:
-            raise ServiceError(
-                f"No content returned for source {source_id}",
-                user_message="Failed to get source content.",
-            )
-        content = result.get("content", "")
-        return {
-            "content": content,
-            "title": result.get("title", ""),
-            "source_type": result.get("type", "unknown"),
-            "char_count": len(content),
-        }
-    except ServiceError:
-        raise
-    except Exception as e:
+    result = client.get_source_fulltext(source_id)
+    if not result:
         raise ServiceError(
-            f"Failed to get content for source {source_id}: {e}",
+            f"No content returned for source {source_id}",
             user_message="Failed to get source content.",
         )
+    content = result.get("content", "")
+    return {
+        "content": content,
+        "title": result.get("title", ""),
+        "source_type": result.get("type", "unknown"),
+        # The client already reports the length; count only if it is absent.
+        "char_count": result.get("char_count") or len(content),
+    }
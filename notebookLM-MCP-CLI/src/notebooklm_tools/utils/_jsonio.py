@@ -0,0 +1,77 @@
+"""JSON encoding and decoding shared by core, utils and services.
+
+This is the one place that picks between orjson and the stdlib: batchexecute
+payloads, CDP messages, auth files and service results all go through it.
+orjson is optional (``pip install notebooklm-mcp-cli[fast]``); without it the
+stdlib ``json`` module is used. For plain str/int/bool/None data and finite
+floats in their shortest form the two backends produce the same text, but
+they differ on other values, so output depends on which one is installed:
+
+- datetime/date/time/UUID: orjson writes RFC 3339 (``2024-01-01T12:00:00``);
+  the stdlib falls back to ``str()`` (``2024-01-01 12:00:00``).
+- NaN/Infinity: orjson writes ``null``; the stdlib writes ``NaN`` (not JSON).
+- Float spelling: orjson ``1e20``, stdlib ``1e+20``.
+- Non-str keys: int/float/bool/None keys become strings in both, but keys of
+  other types (e.g. datetime) are only accepted by orjson.
+"""
+
+import dataclasses
+import json as _stdlib_json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+_ORJSON_OPTS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS) if orjson else 0
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text or UTF-8 bytes.
+
+    Input orjson rejects but the stdlib accepts (such as NaN) is re-parsed
+    with json. Raises json.JSONDecodeError for invalid JSON either way
+    (orjson's error is a subclass).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return _stdlib_json.loads(data)
+
+
+def to_json(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes.
+
+    Args:
+        obj: Dict/list to encode (values that are not JSON-native fall back to str())
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        opts = _ORJSON_OPTS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTS
+        return orjson.dumps(obj, default=str, option=opts)
+    if indent:
+        text = _stdlib_json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+    else:
+        # Compact separators, as orjson writes them
+        text = _stdlib_json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":"),
+        )
+    return text.encode("utf-8")
+
+
+def _default(obj: Any) -> Any:
+    """stdlib fallback hook: dataclass rows as dicts, anything else as str()."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> str:
+    """Serialize an object to a JSON string (see :func:`to_json`)."""
+    return to_json(obj, indent=indent).decode("utf-8")
@@ -1,5 +1,6 @@
 """Browser cookie utilities."""
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -11,6 +12,17 @@ from notebooklm_tools.core.exceptions import AuthenticationError
 NOTEBOOKLM_DOMAIN = ".google.com"
 NOTEBOOKLM_URL = "https://notebooklm.google.com"
 
+# Google auth cookies; at least two must be present for a plausible session
+_ESSENTIAL_COOKIES = ("SID", "HSID", "SSID", "APISID", "SAPISID")
+
+# Cookie header inside a "Copy as cURL" command, and a leading "Cookie:" label
+_CURL_COOKIE_RE = re.compile(r"-H\s+['\"]Cookie:\s*([^'\"]+)['\"]", re.IGNORECASE)
+_COOKIE_HEADER_PREFIX_RE = re.compile(r"^cookie:\s*", re.IGNORECASE)
+# JSON cookie exports start with an object or array (optionally after a BOM)
+_JSON_START_RE = re.compile(rb"(?:\xef\xbb\xbf)?\s*[\[{]")
+# One "name=value" pair per ;-separated part, surrounding whitespace trimmed
+_COOKIE_KV_RE = re.compile(r"(?:^|;)\s*([^=;]*?)\s*=\s*([^;]*?)\s*(?=;|\Z)")
+
 
 def parse_cookies_from_file(file_path: str | Path) -> dict[str, str]:
     """
@@ -30,51 +42,57 @@ def parse_cookies_from_file(file_path: str | Path) -> dict[str, str]:
     Raises:
         AuthenticationError: If file cannot be parsed.
     """
-    path = Path(file_path).expanduser()
+    path = Path(file_path).expanduser().resolve()
     
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError as e:
         raise AuthenticationError(
             message=f"Cookie file not found: {path}",
             hint="Create the file with cookies copied from browser DevTools.",
-        )
+        ) from e
     
-    content = path.read_text().strip()
+    # Parsed results are reused until the file's mtime or size changes;
+    # callers get their own copy so the cached dict is never mutated.
+    return dict(_parse_cookie_file(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_cookie_file(path_str: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse a cookie file; (mtime_ns, size) only key the cache."""
+    raw = Path(path_str).read_bytes()
     
-    # Try to parse as JSON first
-    try:
-        data = json.loads(content)
-        if isinstance(data, dict):
-            return {str(k): str(v) for k, v in data.items()}
-        if isinstance(data, list):
-            # List of cookie objects
-            cookies = {}
-            for item in data:
-                if isinstance(item, dict) and "name" in item and "value" in item:
-                    cookies[item["name"]] = item["value"]
-            if cookies:
-                return cookies
-    except json.JSONDecodeError:
-        pass
+    # Try to parse as JSON first (json.loads accepts bytes directly), but
+    # only when the file looks like JSON; header/cURL dumps skip the parser.
+    if _JSON_START_RE.match(raw):
+        try:
+            data = json.loads(raw)
+            if isinstance(data, dict):
+                return {str(k): str(v) for k, v in data.items()}
+            if isinstance(data, list):
+                # List of cookie objects
+                cookies = {
+                    item["name"]: item["value"]
+                    for item in data
+                    if isinstance(item, dict) and "name" in item and "value" in item
+                }
+                if cookies:
+                    return cookies
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            pass
+    
+    content = raw.decode("utf-8", "replace").strip()
     
     # Try to extract from cURL command
-    curl_match = re.search(r"-H\s+['\"]Cookie:\s*([^'\"]+)['\"]", content, re.IGNORECASE)
+    curl_match = _CURL_COOKIE_RE.search(content)
     if curl_match:
         content = curl_match.group(1)
     
     # Try to extract Cookie header value
-    if content.lower().startswith("cookie:"):
-        content = content[7:].strip()
+    content = _COOKIE_HEADER_PREFIX_RE.sub("", content, count=1)
     
     # Parse cookie string (name=value; name2=value2)
-    cookies: dict[str, str] = {}
-    for part in content.split(";"):
-        part = part.strip()
-        if "=" in part:
-            name, _, value = part.partition("=")
-            name = name.strip()
-            value = value.strip()
-            if name and value:
-                cookies[name] = value
+    cookies = {name: value for name, value in _COOKIE_KV_RE.findall(content) if name and value}
     
     if not cookies:
         raise AuthenticationError(
@@ -96,7 +114,12 @@ def validate_notebooklm_cookies(cookies: dict[str, str]) -> bool:
     
     This is a basic check - actual validation requires making an API call.
     """
-    # Check for essential Google auth cookies
-    essential_patterns = ["SID", "HSID", "SSID", "APISID", "SAPISID"]
-    found = sum(1 for pattern in essential_patterns if any(pattern in name for name in cookies))
-    return found >= 2  # At least 2 essential cookies should be present
+    # Exact names are the common case; the substring scan keeps accepting
+    # variants such as __Secure-1PSID. Stop as soon as two are found.
+    hits = 0
+    for pattern in _ESSENTIAL_COOKIES:
+        if pattern in cookies or any(pattern in name for name in cookies):
+            hits += 1
+            if hits >= 2:
+                return True
+    return False
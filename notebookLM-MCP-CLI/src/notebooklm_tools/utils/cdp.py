@@ -9,24 +9,65 @@ Usage:
     3. No keychain access required!
 """
 
-import json
+import copy
+import itertools
+import os
 import platform
 import re
 import shutil
+import socket
 import subprocess
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote, urlparse
 
-from httpx import Client
-httpx_client = Client()
+import httpx
 import websocket
 
+from notebooklm_tools.core.exceptions import AuthenticationError
+from notebooklm_tools.utils._jsonio import loads as _ws_loads, to_json as _ws_dumps
+from notebooklm_tools.utils.config import get_chrome_profile_dir
+
+# Shared client for the DevTools HTTP endpoints (/json/version, /json, /json/new):
+# keep-alive connections to the browser are reused across discovery calls.
+httpx_client = httpx.Client(
+    transport=httpx.HTTPTransport(
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0),
+    ),
+)
+# Local port probes: a loopback connect either succeeds or is refused at once,
+# so a slow connect means nothing useful is listening.
+_PROBE_TIMEOUT = httpx.Timeout(2.0, connect=0.2)
+_PORT_CONNECT_TIMEOUT = 0.2
+# The DevTools port that last worked for a profile is kept in this file in the
+# profile dir and tried first; a live Chrome answers well within the timeout.
+_LAST_PORT_FILE = ".nlm_cdp_port"
+_LAST_PORT_TIMEOUT = httpx.Timeout(0.2)
+
 _cached_ws: websocket.WebSocket | None = None
 _cached_ws_url: str | None = None
-
-from notebooklm_tools.core.exceptions import AuthenticationError
+# Serializes use of the cached connection: without it one thread could replace
+# or close the socket another is reading from. Reentrant because helpers that
+# hold it (e.g. _ensure_domain) call execute_cdp_command.
+_ws_lock = threading.RLock()
+# Longest wait for any one frame while a command awaits its reply, so an
+# unresponsive page fails the command instead of stalling the caller.
+_CDP_COMMAND_TIMEOUT = 10.0
+# CDP command ids, unique per process so a reply can never be mistaken for
+# the reply to another (possibly concurrent or abandoned) command.
+_next_id = itertools.count(1)
+_id_lock = threading.Lock()
+# Event frames (e.g. Page.frameNavigated) read while waiting for a command's
+# reply, per page ws_url, kept for event consumers such as the login wait.
+_EVENT_BUFFER_SIZE = 256
+_pending_events: dict[str, deque] = {}
+# CDP domains (e.g. "Runtime", "Page") already enabled, per page ws_url, on the
+# cached connection. Cleared whenever the cached connection is replaced.
+_enabled_domains: dict[str, set[str]] = {}
 
 
 CDP_DEFAULT_PORT = 9222
@@ -78,7 +119,6 @@ def find_available_port(starting_from: int = 9222, max_attempts: int = 10) -> in
     Raises:
         RuntimeError: If no available ports found
     """
-    import socket
     for offset in range(max_attempts):
         port = starting_from + offset
         try:
@@ -113,42 +153,101 @@ def get_chrome_path() -> str | None:
     return None
 
 
-# Import Chrome profile directory from unified config
-from notebooklm_tools.utils.config import get_chrome_profile_dir
-
-
 def is_profile_locked(profile_name: str = "default") -> bool:
     """Check if the Chrome profile is locked (Chrome is using it)."""
     lock_file = get_chrome_profile_dir(profile_name) / "SingletonLock"
     return lock_file.exists()
 
 
-def find_existing_nlm_chrome(port_range: range = CDP_PORT_RANGE) -> tuple[int | None, str | None]:
+def _is_listening(port: int) -> bool:
+    """Check whether something accepts TCP connections on a local port.
+
+    A loopback connect either succeeds or is refused almost at once; the
+    short timeout covers OSes that drop packets instead of refusing, so a
+    closed port never costs a long wait. Unlike a bind() probe this cannot
+    mistake a port that is merely unbindable (e.g. held by another user's
+    socket on a different address) for a listening one.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(_PORT_CONNECT_TIMEOUT)
+        return s.connect_ex(('127.0.0.1', port)) == 0
+
+
+def _probe_devtools_port(port: int) -> str | None:
+    """Return the debugger URL if a DevTools endpoint listens on port."""
+    if not _is_listening(port):
+        return None
+    return get_debugger_url(port, timeout=_PROBE_TIMEOUT)
+
+
+def _read_last_port(profile_name: str) -> int | None:
+    """Return the DevTools port saved for a profile, or None if unknown."""
+    try:
+        text = (get_chrome_profile_dir(profile_name) / _LAST_PORT_FILE).read_text()
+        return int(text)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_last_port(profile_name: str, port: int) -> None:
+    """Remember the DevTools port that worked for a profile (best effort)."""
+    try:
+        (get_chrome_profile_dir(profile_name) / _LAST_PORT_FILE).write_text(str(port))
+    except OSError:
+        pass
+
+
+def find_existing_nlm_chrome(
+    port_range: range = CDP_PORT_RANGE, profile_name: str = "default",
+) -> tuple[int | None, str | None]:
     """Find an existing NLM Chrome instance on any port in range.
     
     Scans the port range looking for a Chrome DevTools endpoint.
     This allows reconnecting to an existing auth Chrome window.
+    The port saved for ``profile_name`` by a previous run is tried
+    first, so a still-running Chrome is found without a scan.
     
     Returns:
         The port number and debugger URL if found, (None, None) otherwise
     """
-    import socket
-    for port in port_range:
-        # First check if the port is in use. If `bind` succeeds, the port is unused, 
-        # meaning Chrome is NOT listening there. This avoids a 2-second timeout 
-        # on OSes that drop packets instead of actively refusing connection.
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.bind(('127.0.0.1', port))
-                # Port is available (not in use), so move to the next one
-                continue
-        except OSError:
-            # Port is in use, let's see if it's a Chrome DevTools endpoint
-            pass
+    # Ports in preference order: the one this process launched Chrome on,
+    # then the default, then the rest of the range ascending. When several
+    # DevTools endpoints answer, the first one in this order wins.
+    chrome_port = _chrome_port
+    preferred = [p for p in (chrome_port, CDP_DEFAULT_PORT) if p is not None and p in port_range]
+    ports = list(dict.fromkeys([*preferred, *port_range]))
+    if not ports:
+        return None, None
+
+    if chrome_port is not None and chrome_port in port_range:
+        debugger_url = _probe_devtools_port(chrome_port)
+        if debugger_url:
+            return chrome_port, debugger_url
+        ports.remove(chrome_port)
 
-        debugger_url = get_debugger_url(port, timeout=2)
+    last_port = _read_last_port(profile_name)
+    if last_port is not None and last_port in ports:
+        debugger_url = get_debugger_url(last_port, timeout=_LAST_PORT_TIMEOUT)
         if debugger_url:
-            return port, debugger_url
+            return last_port, debugger_url
+        ports.remove(last_port)
+    if not ports:
+        return None, None
+
+    # Probe ports concurrently: a non-Chrome listener can take the full
+    # timeout to answer, so a serial scan would add those timeouts up.
+    # Results are read back in preference order, so the answer does not
+    # depend on which probe finishes first.
+    executor = ThreadPoolExecutor(max_workers=len(ports))
+    try:
+        futures = [executor.submit(_probe_devtools_port, port) for port in ports]
+        for port, future in zip(ports, futures, strict=True):
+            debugger_url = future.result()
+            if debugger_url:
+                return port, debugger_url
+    finally:
+        # Don't wait for lower-preference probes once an endpoint has been found
+        executor.shutdown(wait=False, cancel_futures=True)
     return None, None
 
 
@@ -198,6 +297,16 @@ def launch_chrome(port: int = CDP_DEFAULT_PORT, headless: bool = False, profile_
     return _chrome_process is not None
 
 
+def _wait_for_exit(process: subprocess.Popen, timeout: float, interval: float = 0.02) -> bool:
+    """Poll until the process exits or timeout passes. Returns True if it exited."""
+    deadline = time.monotonic() + timeout
+    while process.poll() is None:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
 def terminate_chrome(process: subprocess.Popen | None = None, port: int | None = None) -> bool:
     """Terminate the Chrome process launched by this module.
     
@@ -213,26 +322,27 @@ def terminate_chrome(process: subprocess.Popen | None = None, port: int | None =
         return False
 
     # Attempt graceful shutdown via CDP to prevent "Restore Pages" warnings on next launch
-    try:
-        if port or _cached_ws_url:
-            execute_cdp_command(_cached_ws_url or get_debugger_url(_chrome_port), "Browser.close")
-            _cached_ws.close()
-        else:
-            # No fast path, use slow path
-            process.terminate()
-    except Exception:
-        pass # Ignore connection drops or failures during close
+    with _ws_lock:
+        try:
+            if port or _cached_ws_url:
+                execute_cdp_command(_cached_ws_url or get_debugger_url(_chrome_port), "Browser.close")
+                _cached_ws.close()
+            else:
+                # No fast path, use slow path
+                process.terminate()
+        except Exception:
+            pass # Ignore connection drops or failures during close
 
-    _cached_ws = _cached_ws_url = None
+        _cached_ws = _cached_ws_url = None
 
-    try:
-        # Wait up to 5 seconds for the graceful shutdown to finish
-        process.wait(timeout=5)
-    except Exception:
+    # Wait up to 5 seconds for the graceful shutdown to finish, returning as
+    # soon as Chrome has exited (usually ~100ms after Browser.close)
+    if not _wait_for_exit(process, 5):
         # If it didn't close in time, force terminate
         try:
             process.terminate()
-            process.wait(timeout=5)
+            if not _wait_for_exit(process, 5):
+                process.kill()
         except Exception:
             try:
                 process.kill()
@@ -245,7 +355,9 @@ def terminate_chrome(process: subprocess.Popen | None = None, port: int | None =
     return True
 
 
-def get_debugger_url(port: int = CDP_DEFAULT_PORT, *, tries: int = 1, timeout: int = 5) -> str | None:
+def get_debugger_url(
+    port: int = CDP_DEFAULT_PORT, *, tries: int = 1, timeout: float | httpx.Timeout = 5,
+) -> str | None:
     """Get the WebSocket debugger URL for Chrome."""
     for attempt in range(tries):
         try:
@@ -270,12 +382,22 @@ def get_pages_by_cdp_url(cdp_http_url: str) -> list[dict]:
 
 def find_or_create_notebooklm_page_by_cdp_url(cdp_http_url: str) -> dict | None:
     """Find an existing NotebookLM page or create one on a given CDP endpoint."""
-    pages = get_pages_by_cdp_url(cdp_http_url)
+    try:
+        raw = httpx_client.get(f"{cdp_http_url}/json", timeout=5).content
+    except Exception:
+        raw = b""
 
-    for page in pages:
-        url = page.get("url", "")
-        if "notebooklm.google.com" in url:
-            return page
+    # With many tabs open the target list is large; only parse it when the
+    # NotebookLM host appears somewhere in the raw bytes.
+    if b"notebooklm.google.com" in raw:
+        try:
+            pages = _ws_loads(raw)
+        except ValueError:
+            pages = []
+        for page in pages:
+            url = page.get("url", "")
+            if "notebooklm.google.com" in url:
+                return page
 
     try:
         encoded_url = quote(NOTEBOOKLM_URL, safe="")
@@ -304,56 +426,136 @@ def find_or_create_notebooklm_page(port: int = CDP_DEFAULT_PORT) -> dict | None:
     """Find an existing NotebookLM page or create a new one."""
     return find_or_create_notebooklm_page_by_cdp_url(f"http://localhost:{port}")
 
-def execute_cdp_command(ws_url: str, method: str, params: dict | None = None, *, retry: bool = True) -> dict:
-    """Execute a CDP command via WebSocket.
-    
-    Args:
-        ws_url: WebSocket URL for the page
-        method: CDP method name (e.g., "Network.getCookies")
-        params: Optional parameters for the command
-    
-    Returns:
-        The result of the CDP command
+def _get_ws(ws_url: str) -> websocket.WebSocket:
+    """Return the cached WebSocket for ws_url, connecting if needed.
+
+    Callers that use the returned socket should hold ``_ws_lock``.
     """
     global _cached_ws, _cached_ws_url
 
-    if retry:
-        # Retry once in case of stale cached connection
-        try:
-            return execute_cdp_command(ws_url, method, params, retry=False)
-        except Exception:
-            # Try again without the cached connection
-            _cached_ws = _cached_ws_url = None
+    with _ws_lock:
+        if ws_url == _cached_ws_url and _cached_ws:
+            return _cached_ws
 
-    if ws_url != _cached_ws_url or not _cached_ws:
         if _cached_ws:
             _cached_ws.close()
             _cached_ws = None
+        # Enabled domains and buffered events belong to the old connection
+        _enabled_domains.clear()
+        _pending_events.clear()
 
         # suppress_origin=True is required for some managed Chrome/CDP endpoints
         # (e.g. OpenClaw browser profile) that reject default Origin headers.
+        # skip_utf8_validation: without wsaccel, websocket-client checks every text
+        # frame with a pure-Python UTF-8 DFA (~0.3s per MB of page HTML); the JSON
+        # decoder validates the bytes anyway.
         try:
-            ws = websocket.create_connection(ws_url, timeout=30, suppress_origin=True)
+            ws = websocket.create_connection(
+                ws_url, timeout=30, suppress_origin=True, skip_utf8_validation=True,
+            )
         except TypeError:
             # Older websocket-client versions may not support suppress_origin.
-            ws = websocket.create_connection(ws_url, timeout=30)
+            ws = websocket.create_connection(ws_url, timeout=30, skip_utf8_validation=True)
         _cached_ws = ws
         _cached_ws_url = ws_url
-    else:
-        ws = _cached_ws
+        return ws
 
-    command = {
-        "id": 1,
-        "method": method,
-        "params": params or {}
-    }
-    ws.send(json.dumps(command))
 
-    # Wait for response with matching ID
-    while True:
-        response = json.loads(ws.recv())
-        if response.get("id") == 1:
-            return response.get("result", {})
+def execute_cdp_command(ws_url: str, method: str, params: dict | None = None) -> dict:
+    """Execute a CDP command via WebSocket.
+    
+    Args:
+        ws_url: WebSocket URL for the page
+        method: CDP method name (e.g., "Network.getCookies")
+        params: Optional parameters for the command
+    
+    Returns:
+        The result of the CDP command
+    """
+    return execute_cdp_batch(ws_url, [(method, params)])[0]
+
+
+def execute_cdp_batch(ws_url: str, commands: list[tuple[str, dict | None]]) -> list[dict]:
+    """Execute several CDP commands in one WebSocket round-trip.
+
+    All commands are sent back-to-back before any response is read; the
+    responses are then collected by id, so the batch costs one round-trip
+    instead of one per command. Chrome processes a target's commands in
+    order, so later commands may depend on earlier ones (e.g. an enable).
+    The cached connection is held for the whole batch, and each frame read
+    times out after _CDP_COMMAND_TIMEOUT seconds.
+
+    Args:
+        ws_url: WebSocket URL for the page
+        commands: (method, params) pairs; params may be None
+
+    Returns:
+        The result of each command, in the order given
+    """
+    global _cached_ws, _cached_ws_url
+
+    with _ws_lock:
+        for attempt in (0, 1):
+            try:
+                ws = _get_ws(ws_url)
+                ws.settimeout(_CDP_COMMAND_TIMEOUT)
+
+                ids = []
+                for method, params in commands:
+                    with _id_lock:
+                        command_id = next(_next_id)
+                    ids.append(command_id)
+                    ws.send(_ws_dumps({"id": command_id, "method": method, "params": params or {}}))
+
+                # Collect responses by id; event frames are buffered, stale replies skipped
+                pending = set(ids)
+                results: dict[int, dict] = {}
+                while pending:
+                    response = _recv_message(ws)
+                    response_id = response.get("id")
+                    if response_id in pending:
+                        pending.discard(response_id)
+                        results[response_id] = response.get("result", {})
+                    elif response_id is None and "method" in response:
+                        _buffer_event(ws_url, response)
+                return [results[command_id] for command_id in ids]
+            except Exception:
+                if attempt:
+                    raise
+                # Retry once without the cached connection, in case it was stale
+                if _cached_ws is not None:
+                    try:
+                        _cached_ws.close()
+                    except Exception:
+                        pass
+                _cached_ws = _cached_ws_url = None
+    raise AssertionError("unreachable")
+
+
+def _recv_message(ws: websocket.WebSocket) -> dict:
+    """Read one CDP message, decoding the raw frame bytes straight from JSON.
+
+    Chrome only accepts text frames, so messages stay text; reading the
+    payload with recv_data() skips websocket-client's bytes-to-str decode.
+    """
+    _, data = ws.recv_data()
+    return _ws_loads(data)
+
+
+def _buffer_event(ws_url: str, event: dict) -> None:
+    """Keep an event frame for later consumers (oldest dropped when full)."""
+    buffered = _pending_events.get(ws_url)
+    if buffered is None:
+        buffered = _pending_events[ws_url] = deque(maxlen=_EVENT_BUFFER_SIZE)
+    buffered.append(event)
+
+
+def _next_message(ws_url: str, ws: websocket.WebSocket) -> dict:
+    """Return the next buffered event for the page, else read a frame."""
+    buffered = _pending_events.get(ws_url)
+    if buffered:
+        return buffered.popleft()
+    return _recv_message(ws)
 
 
 def get_page_cookies(ws_url: str) -> list[dict]:
@@ -369,15 +571,43 @@ def get_page_cookies(ws_url: str) -> list[dict]:
     return result.get("cookies", [])
 
 
-def get_page_html(ws_url: str) -> str:
-    """Get the page HTML to extract CSRF token."""
-    execute_cdp_command(ws_url, "Runtime.enable")
-    result = execute_cdp_command(
-        ws_url,
-        "Runtime.evaluate",
-        {"expression": "document.documentElement.outerHTML"}
+def get_page_cookies_and_html(ws_url: str) -> tuple[list[dict], str]:
+    """Get all cookies and the page HTML in a single CDP round-trip.
+
+    Equivalent to get_page_cookies() followed by get_page_html().
+    """
+    _, cookie_result, html_result = execute_cdp_batch(ws_url, [
+        ("Runtime.enable", None),
+        ("Network.getAllCookies", None),
+        ("Runtime.evaluate", {"expression": "document.documentElement.outerHTML"}),
+    ])
+    _enabled_domains.setdefault(ws_url, set()).add("Runtime")
+    return (
+        cookie_result.get("cookies", []),
+        html_result.get("result", {}).get("value", ""),
     )
-    return result.get("result", {}).get("value", "")
+
+
+def _ensure_domain(ws_url: str, domain: str) -> None:
+    """Send ``<domain>.enable`` unless it was already sent on this connection."""
+    with _ws_lock:
+        _get_ws(ws_url)  # (Re)connecting first drops the state of a replaced connection
+        if domain not in _enabled_domains.get(ws_url, ()):
+            execute_cdp_command(ws_url, f"{domain}.enable")
+            _enabled_domains.setdefault(ws_url, set()).add(domain)
+
+
+def get_page_html(ws_url: str) -> str:
+    """Get the page HTML to extract CSRF token.
+
+    Read straight from the DOM agent (DOM.getOuterHTML on the document node),
+    which needs neither the Runtime domain nor a JavaScript evaluation.
+    """
+    root = execute_cdp_command(ws_url, "DOM.getDocument", {"depth": 0}).get("root")
+    if not root:
+        return ""
+    result = execute_cdp_command(ws_url, "DOM.getOuterHTML", {"nodeId": root["nodeId"]})
+    return result.get("outerHTML", "")
 
 
 def get_document_root(ws_url: str) -> dict:
@@ -398,7 +628,7 @@ def query_selector(ws_url: str, node_id: int, selector: str) -> int | None:
 
 def get_current_url(ws_url: str) -> str:
     """Get the current page URL."""
-    execute_cdp_command(ws_url, "Runtime.enable")
+    _ensure_domain(ws_url, "Runtime")
     result = execute_cdp_command(
         ws_url,
         "Runtime.evaluate",
@@ -407,12 +637,95 @@ def get_current_url(ws_url: str) -> str:
     return result.get("result", {}).get("value", "")
 
 
+def get_url_and_html(ws_url: str) -> tuple[str, str]:
+    """Get the current page URL and HTML with a single evaluate."""
+    _ensure_domain(ws_url, "Runtime")
+    result = execute_cdp_command(
+        ws_url,
+        "Runtime.evaluate",
+        {
+            "expression": "JSON.stringify({u: location.href, h: document.documentElement.outerHTML})",
+            "returnByValue": True,
+        },
+    )
+    value = result.get("result", {}).get("value")
+    if not value:
+        return "", ""
+    data = _ws_loads(value)
+    return data.get("u", ""), data.get("h", "")
+
+
 def navigate_to_url(ws_url: str, url: str) -> None:
     """Navigate the page to a URL."""
-    execute_cdp_command(ws_url, "Page.enable")
+    _ensure_domain(ws_url, "Page")
     execute_cdp_command(ws_url, "Page.navigate", {"url": url})
 
 
+# While waiting for login, re-read the URL this often in case an event was missed
+LOGIN_RECHECK_INTERVAL = 5.0
+# Longest the login wait holds the shared connection for one frame read, so
+# other CDP callers are not shut out for the whole login.
+_LOGIN_READ_SLICE = 0.5
+
+
+def wait_for_logged_in_url(ws_url: str, timeout: float) -> str:
+    """Wait until the page reaches a logged-in URL, or until timeout.
+
+    Blocks on the page's Page.frameNavigated events rather than polling, so
+    the login is seen as soon as the browser lands on NotebookLM. The URL is
+    also re-read every LOGIN_RECHECK_INTERVAL seconds, and if the event
+    stream fails the wait falls back to polling every 0.5s. The connection
+    lock is taken per frame read, not for the whole wait.
+
+    Returns:
+        The last known page URL (check it with is_logged_in)
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        with _ws_lock:
+            _ensure_domain(ws_url, "Page")
+        current_url = get_current_url(ws_url)
+        next_check = time.monotonic() + LOGIN_RECHECK_INTERVAL
+        while not is_logged_in(current_url):
+            now = time.monotonic()
+            if now >= deadline:
+                return current_url
+            if now >= next_check:
+                current_url = get_current_url(ws_url)
+                next_check = now + LOGIN_RECHECK_INTERVAL
+                continue
+            with _ws_lock:
+                ws = _get_ws(ws_url)
+                ws.settimeout(min(deadline - now, next_check - now, _LOGIN_READ_SLICE))
+                try:
+                    message = _next_message(ws_url, ws)
+                except websocket.WebSocketTimeoutException:
+                    continue
+                finally:
+                    ws.settimeout(_CDP_COMMAND_TIMEOUT)
+            if message.get("method") == "Page.frameNavigated":
+                frame = message.get("params", {}).get("frame", {})
+                if "parentId" not in frame:  # Main frame only
+                    current_url = frame.get("url", current_url)
+        return current_url
+    except Exception:
+        return _poll_for_login(ws_url, deadline)
+
+
+def _poll_for_login(ws_url: str, deadline: float) -> str:
+    """Fallback for wait_for_logged_in_url: poll the page URL every 0.5s."""
+    current_url = ""
+    while time.monotonic() < deadline:
+        try:
+            current_url = get_current_url(ws_url)
+            if is_logged_in(current_url):
+                break
+        except Exception:
+            pass
+        time.sleep(.5)
+    return current_url
+
+
 def is_logged_in(url: str) -> bool:
     """Check login status by URL.
     
@@ -425,6 +738,35 @@ def is_logged_in(url: str) -> bool:
     return False
 
 
+# Page-token patterns, compiled once at import
+_BL_RE = re.compile(r'"cfb2h":"([^"]+)"')
+_CSRF_RE = re.compile(r'"SNlM0e":"([^"]+)"')
+_SESSION_ID_RES = (
+    re.compile(r'"FdrFJe":"(\d+)"'),
+    re.compile(r'f\.sid["\s:=]+["\']?(\d+)'),
+)
+# Various patterns Google uses to embed the email, in priority order
+_EMAIL_RES = (
+    re.compile(r'"oPEP7c":"([^"]+@[^"]+)"'),  # Google's internal email field
+    re.compile(r'data-email="([^"]+)"'),  # data-email attribute
+    re.compile(r'"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"'),  # Generic email in quotes
+)
+
+
+def extract_all(html: str) -> dict[str, str]:
+    """Extract CSRF token, session ID, email and build label from page HTML.
+
+    Returns:
+        Dict with csrf_token, session_id, email and build_label ("" if absent)
+    """
+    return {
+        "csrf_token": extract_csrf_token(html),
+        "session_id": extract_session_id(html),
+        "email": extract_email(html),
+        "build_label": extract_build_label(html),
+    }
+
+
 def extract_build_label(html: str) -> str:
     """Extract the build label (bl) from page HTML.
 
@@ -432,24 +774,20 @@ def extract_build_label(html: str) -> str:
     inline configuration JSON. This value is used as the 'bl' URL parameter
     in batchexecute and query requests.
     """
-    match = re.search(r'"cfb2h":"([^"]+)"', html)
+    match = _BL_RE.search(html)
     return match.group(1) if match else ""
 
 
 def extract_csrf_token(html: str) -> str:
     """Extract CSRF token from page HTML."""
-    match = re.search(r'"SNlM0e":"([^"]+)"', html)
+    match = _CSRF_RE.search(html)
     return match.group(1) if match else ""
 
 
 def extract_session_id(html: str) -> str:
     """Extract session ID from page HTML."""
-    patterns = [
-        r'"FdrFJe":"(\d+)"',
-        r'f\.sid["\s:=]+["\']?(\d+)',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, html)
+    for pattern in _SESSION_ID_RES:
+        match = pattern.search(html)
         if match:
             return match.group(1)
     return ""
@@ -457,15 +795,10 @@ def extract_session_id(html: str) -> str:
 
 def extract_email(html: str) -> str:
     """Extract user email from page HTML."""
-    # Try various patterns Google uses to embed the email
-    patterns = [
-        r'"oPEP7c":"([^"]+@[^"]+)"',  # Google's internal email field
-        r'data-email="([^"]+)"',  # data-email attribute
-        r'"([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"',  # Generic email in quotes
-    ]
-    for pattern in patterns:
-        matches = re.findall(pattern, html)
-        for match in matches:
+    for pattern in _EMAIL_RES:
+        # finditer stops at the first acceptable match instead of collecting all
+        for m in pattern.finditer(html):
+            match = m.group(1)
             # Filter out common false positives
             if '@google.com' not in match and '@gstatic' not in match:
                 if '@' in match and '.' in match.split('@')[-1]:
@@ -473,6 +806,13 @@ def extract_email(html: str) -> str:
     return ""
 
 
+# Recent extract_cookies_via_cdp results: (port, profile_name) -> (expires_at, result).
+# Back-to-back auth attempts within the TTL reuse the result instead of repeating
+# the whole Chrome/CDP exchange.
+_RESULT_CACHE_TTL = 5.0
+_RESULT_CACHE: dict[tuple[int, str], tuple[float, dict[str, Any]]] = {}
+
+
 def extract_cookies_via_cdp(
     port: int = CDP_DEFAULT_PORT,
     auto_launch: bool = True,
@@ -499,9 +839,13 @@ def extract_cookies_via_cdp(
     Raises:
         AuthenticationError: If extraction fails
     """
+    cache_key = (port, profile_name)
+    if not clear_profile:
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+
     if clear_profile:
-        from notebooklm_tools.utils.config import get_chrome_profile_dir
-        import shutil
         profile_dir = get_chrome_profile_dir(profile_name)
         if profile_dir.exists():
             shutil.rmtree(profile_dir, ignore_errors=True)
@@ -511,7 +855,7 @@ def extract_cookies_via_cdp(
     reused_existing = False
     existing_port, debugger_url = None, None
     if not clear_profile:
-        existing_port, debugger_url = find_existing_nlm_chrome()
+        existing_port, debugger_url = find_existing_nlm_chrome(profile_name=profile_name)
         
     if existing_port:
         port = existing_port
@@ -553,8 +897,10 @@ def extract_cookies_via_cdp(
             message=f"Cannot connect to Chrome on port {port}",
             hint="Use 'nlm login --manual' to import cookies from a file.",
         )
+    _save_last_port(profile_name, port)
     result = extract_cookies_from_page(f"http://localhost:{port}", wait_for_login, login_timeout)
     result["reused_existing"] = reused_existing
+    _RESULT_CACHE[cache_key] = (time.monotonic() + _RESULT_CACHE_TTL, copy.deepcopy(result))
     return result
 
 def extract_cookies_via_existing_cdp(
@@ -611,15 +957,7 @@ def extract_cookies_from_page(
     current_url = get_current_url(ws_url)
 
     if not is_logged_in(current_url) and wait_for_login:
-        start_time = time.time()
-        while time.time() - start_time < login_timeout:
-            time.sleep(.5)
-            try:
-                current_url = get_current_url(ws_url)
-                if is_logged_in(current_url):
-                    break
-            except Exception:
-                pass
+        current_url = wait_for_logged_in_url(ws_url, login_timeout)
 
         if not is_logged_in(current_url):
             raise AuthenticationError(
@@ -627,8 +965,8 @@ def extract_cookies_from_page(
                 hint="Please log in to NotebookLM in the connected browser window.",
             )
 
-    # Extract cookies
-    cookies = get_page_cookies(ws_url)
+    # Extract cookies, plus page HTML for CSRF, session ID, email, and build label
+    cookies, html = get_page_cookies_and_html(ws_url)
 
     if not cookies:
         raise AuthenticationError(
@@ -636,20 +974,7 @@ def extract_cookies_from_page(
             hint="Make sure you're fully logged in.",
         )
 
-    # Get page HTML for CSRF, session ID, email, and build label
-    html = get_page_html(ws_url)
-    csrf_token = extract_csrf_token(html)
-    session_id = extract_session_id(html)
-    email = extract_email(html)
-    build_label = extract_build_label(html)
-
-    return {
-        "cookies": cookies,
-        "csrf_token": csrf_token,
-        "session_id": session_id,
-        "email": email,
-        "build_label": build_label,
-    }
+    return {"cookies": cookies, **extract_all(html)}
 
 
 # =============================================================================
@@ -668,6 +993,33 @@ def has_chrome_profile(profile_name: str = "default") -> bool:
     return cookies_file.exists()
 
 
+def _purge_dir(path: str) -> int:
+    """Delete a directory tree in one pass, returning the bytes of files removed.
+
+    Each entry's size comes from the os.scandir() entry, and files are
+    unlinked as they are visited, so the tree is walked once (unlike sizing
+    it with rglob and then calling shutil.rmtree). Errors are ignored, like
+    ``shutil.rmtree(ignore_errors=True)``.
+    """
+    freed = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        freed += _purge_dir(entry.path)
+                    else:
+                        size = entry.stat(follow_symlinks=False).st_size
+                        os.unlink(entry.path)
+                        freed += size
+                except OSError:
+                    pass
+        os.rmdir(path)
+    except OSError:
+        pass
+    return freed
+
+
 def cleanup_chrome_profile_cache(profile_name: str = "default") -> int:
     """Remove unnecessary cache directories to minimize profile size.
     
@@ -700,13 +1052,7 @@ def cleanup_chrome_profile_cache(profile_name: str = "default") -> int:
     for cache_dir in cache_dirs:
         cache_path = default_dir / cache_dir
         if cache_path.exists():
-            try:
-                # Calculate size before deletion
-                size = sum(f.stat().st_size for f in cache_path.rglob("*") if f.is_file())
-                shutil.rmtree(cache_path, ignore_errors=True)
-                bytes_freed += size
-            except Exception:
-                pass
+            bytes_freed += _purge_dir(str(cache_path))
     
     return bytes_freed
 
@@ -768,8 +1114,8 @@ def run_headless_auth(
         if not ws_url:
             return None
         
-        # Check if logged in by URL
-        current_url = get_current_url(ws_url)
+        # Check if logged in by URL (the HTML is kept for CSRF extraction)
+        current_url, html = get_url_and_html(ws_url)
         if not is_logged_in(current_url):
             # Not logged in - headless can't help
             return None
@@ -781,8 +1127,6 @@ def run_headless_auth(
         if not validate_cookies(cookies):
             return None
         
-        # Get page HTML for CSRF extraction
-        html = get_page_html(ws_url)
         csrf_token = extract_csrf_token(html)
         session_id = extract_session_id(html)
         
@@ -0,0 +1,25 @@
+"""Shared fixtures for core tests."""
+
+import pytest
+
+# Saved-profile files, pre-serialized; the email is filled in as JSON.
+_TEMPLATE_COOKIES = b'[{"name": "SID", "value": "old-sid"}]'
+_TEMPLATE_METADATA = (
+    b'{"csrf_token": "old-token", "session_id": "old-session", "email": %s, '
+    b'"last_validated": "2026-01-01T00:00:00"}'
+)
+
+
+@pytest.fixture(scope="session")
+def profile_templates(tmp_path_factory):
+    """Saved profile directories (cookies.json + metadata.json), keyed by stored email.
+
+    Built once per session; tests copy one into their own tmp_path.
+    """
+    templates = {}
+    for email, email_json in (("work@company.com", b'"work@company.com"'), (None, b"null")):
+        profile_dir = tmp_path_factory.mktemp("profile_template")
+        (profile_dir / "cookies.json").write_bytes(_TEMPLATE_COOKIES)
+        (profile_dir / "metadata.json").write_bytes(_TEMPLATE_METADATA % email_json)
+        templates[email] = profile_dir
+    return templates
@@ -30,117 +30,74 @@ def test_account_mismatch_error_has_hint():
     assert "--force" in err.hint
 
 
-import json
+import functools
+import shutil
 import pytest
 from pathlib import Path
-from notebooklm_tools.core.auth import AuthManager
+import notebooklm_tools.utils.config as config
+from notebooklm_tools.core.auth import AuthManager, AuthTokens, Profile
 from notebooklm_tools.core.exceptions import AccountMismatchError
+from notebooklm_tools.utils.cdp import extract_build_label
+
+_BUILD_LABEL = "boq_labs-tailwind-frontend_20260219.16_p2"
+_HTML = f'var config={{"cfb2h":"{_BUILD_LABEL}","other":"val"}};'
+_NEW_COOKIES = [{"name": "SID", "value": "new-sid"}]
+# A profile saved before build labels were stored
+_OLD_PROFILE_COOKIES = b'{"SID": "abc"}'
+_OLD_PROFILE_METADATA = b'{"csrf_token": "csrf", "session_id": "sid", "email": "test@gmail.com"}'
+
+
+@pytest.fixture(autouse=True)
+def profiles_root(tmp_path_factory, monkeypatch):
+    """Store the test's profiles in a private directory; returns that directory."""
+    root = tmp_path_factory.mktemp("profiles")
+    # AuthManager looks its directory up on every file access; Paths are
+    # immutable, so build each profile's once.
+    monkeypatch.setattr(config, "get_profile_dir", functools.cache(lambda name: root / name))
+    return root
 
 
 class TestSaveProfileMismatchGuard:
     """Tests for the account mismatch guard in save_profile()."""
 
-    def _create_existing_profile(self, tmp_path: Path, email: str) -> AuthManager:
+    def _create_existing_profile(self, profiles_root: Path, templates: dict, email: str) -> AuthManager:
         """Helper: create a profile with existing credentials on disk."""
-        profiles_dir = tmp_path / "profiles" / "test-profile"
-        profiles_dir.mkdir(parents=True)
-
-        cookies = [{"name": "SID", "value": "old-sid"}]
-        (profiles_dir / "cookies.json").write_text(json.dumps(cookies))
-        (profiles_dir / "metadata.json").write_text(json.dumps({
-            "csrf_token": "old-token",
-            "session_id": "old-session",
-            "email": email,
-            "last_validated": "2026-01-01T00:00:00",
-        }))
+        profiles_dir = profiles_root / "test-profile"
+        shutil.copytree(templates[email], profiles_dir)
 
         manager = AuthManager("test-profile")
         # Patch profile_dir to use tmp_path
         manager._test_profile_dir = profiles_dir
         return manager
 
-    def test_save_blocks_when_email_differs(self, tmp_path, monkeypatch):
-        """save_profile should raise AccountMismatchError when emails differ."""
-        manager = self._create_existing_profile(tmp_path, "work@company.com")
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / "profiles" / name,
-        )
-
-        with pytest.raises(AccountMismatchError) as exc_info:
-            manager.save_profile(
-                cookies=[{"name": "SID", "value": "new-sid"}],
-                email="personal@gmail.com",
-            )
-        assert "work@company.com" in str(exc_info.value)
-        assert "personal@gmail.com" in str(exc_info.value)
-
-    def test_save_allows_when_force_true(self, tmp_path, monkeypatch):
-        """save_profile with force=True should overwrite even with different email."""
-        manager = self._create_existing_profile(tmp_path, "work@company.com")
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / "profiles" / name,
-        )
-
-        profile = manager.save_profile(
-            cookies=[{"name": "SID", "value": "new-sid"}],
-            email="personal@gmail.com",
-            force=True,
-        )
-        assert profile.email == "personal@gmail.com"
-
-    def test_save_allows_when_emails_match(self, tmp_path, monkeypatch):
-        """save_profile should work fine when emails match."""
-        manager = self._create_existing_profile(tmp_path, "work@company.com")
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / "profiles" / name,
-        )
-
-        profile = manager.save_profile(
-            cookies=[{"name": "SID", "value": "new-sid"}],
-            email="work@company.com",
-        )
-        assert profile.email == "work@company.com"
-
-    def test_save_allows_when_stored_email_is_none(self, tmp_path, monkeypatch):
-        """save_profile should allow save when stored email is None (first-time setup)."""
-        manager = self._create_existing_profile(tmp_path, None)
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / "profiles" / name,
-        )
-
-        profile = manager.save_profile(
-            cookies=[{"name": "SID", "value": "new-sid"}],
-            email="personal@gmail.com",
-        )
-        assert profile.email == "personal@gmail.com"
-
-    def test_save_allows_when_new_email_is_none(self, tmp_path, monkeypatch):
-        """save_profile should allow save when new email is None (extraction failed)."""
-        manager = self._create_existing_profile(tmp_path, "work@company.com")
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / "profiles" / name,
-        )
-
-        profile = manager.save_profile(
-            cookies=[{"name": "SID", "value": "new-sid"}],
-            email=None,
-        )
-        # Should keep the old email when new is None
-        assert profile is not None
-
-    def test_save_allows_on_fresh_profile(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize("stored_email, new_email, force, expected_email", [
+        # Different account: blocked
+        ("work@company.com", "personal@gmail.com", False, AccountMismatchError),
+        # force=True overwrites even with a different account
+        ("work@company.com", "personal@gmail.com", True, "personal@gmail.com"),
+        ("work@company.com", "work@company.com", False, "work@company.com"),
+        # No stored email (first-time setup)
+        (None, "personal@gmail.com", False, "personal@gmail.com"),
+        # No new email (extraction failed)
+        ("work@company.com", None, False, None),
+    ], ids=["email-differs", "force", "emails-match", "stored-none", "new-none"])
+    def test_save_profile_guard(
+        self, profiles_root, profile_templates, stored_email, new_email, force, expected_email,
+    ):
+        """save_profile blocks only a save that would switch the profile's account."""
+        manager = self._create_existing_profile(profiles_root, profile_templates, stored_email)
+
+        if expected_email is AccountMismatchError:
+            with pytest.raises(AccountMismatchError) as exc_info:
+                manager.save_profile(cookies=_NEW_COOKIES, email=new_email, force=force)
+            assert stored_email in str(exc_info.value)
+            assert new_email in str(exc_info.value)
+        else:
+            profile = manager.save_profile(cookies=_NEW_COOKIES, email=new_email, force=force)
+            assert profile.email == expected_email
+
+    def test_save_allows_on_fresh_profile(self):
         """save_profile should work on a brand new profile with no existing data."""
-        profiles_dir = tmp_path / "profiles" / "new-profile"
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: profiles_dir,
-        )
-
         manager = AuthManager("new-profile")
         profile = manager.save_profile(
             cookies=[{"name": "SID", "value": "first-sid"}],
@@ -149,86 +106,68 @@ class TestSaveProfileMismatchGuard:
         assert profile.email == "first@gmail.com"
 
 
+@pytest.fixture(scope="module")
+def auth_tokens():
+    """AuthTokens carrying a build label (tests must not mutate it)."""
+    return AuthTokens(
+        cookies={"SID": "abc"},
+        csrf_token="csrf",
+        session_id="sid",
+        build_label=_BUILD_LABEL,
+        extracted_at=1000.0,
+    )
+
+
 class TestBuildLabelExtraction:
     """Test build label extraction and profile round-trip."""
 
     def test_extract_build_label_from_html(self):
         """extract_build_label finds cfb2h key in page HTML."""
-        from notebooklm_tools.utils.cdp import extract_build_label
-
-        html = 'var config={"cfb2h":"boq_labs-tailwind-frontend_20260219.16_p2","other":"val"};'
-        assert extract_build_label(html) == "boq_labs-tailwind-frontend_20260219.16_p2"
+        assert extract_build_label(_HTML) == _BUILD_LABEL
 
     def test_extract_build_label_missing(self):
         """extract_build_label returns empty string when key is absent."""
-        from notebooklm_tools.utils.cdp import extract_build_label
-
         assert extract_build_label("<html>no config here</html>") == ""
 
-    def test_auth_tokens_build_label_round_trip(self):
+    def test_auth_tokens_build_label_round_trip(self, auth_tokens):
         """AuthTokens preserves build_label through to_dict/from_dict."""
-        from notebooklm_tools.core.auth import AuthTokens
-
-        tokens = AuthTokens(
-            cookies={"SID": "abc"},
-            csrf_token="csrf",
-            session_id="sid",
-            build_label="boq_labs-tailwind-frontend_20260219.16_p2",
-            extracted_at=1000.0,
-        )
-        d = tokens.to_dict()
-        assert d["build_label"] == "boq_labs-tailwind-frontend_20260219.16_p2"
+        d = auth_tokens.to_dict()
+        assert d["build_label"] == _BUILD_LABEL
 
         restored = AuthTokens.from_dict(d)
-        assert restored.build_label == "boq_labs-tailwind-frontend_20260219.16_p2"
+        assert restored.build_label == _BUILD_LABEL
 
     def test_auth_tokens_build_label_defaults_empty(self):
         """AuthTokens.from_dict handles missing build_label gracefully."""
-        from notebooklm_tools.core.auth import AuthTokens
-
         tokens = AuthTokens.from_dict({"cookies": {"SID": "abc"}})
         assert tokens.build_label == ""
 
-    def test_profile_build_label_round_trip(self, tmp_path, monkeypatch):
-        """Profile save/load preserves build_label in metadata."""
-        from notebooklm_tools.core.auth import AuthManager
-
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / name,
-        )
+    def test_profile_dict_build_label_round_trip(self):
+        """Profile preserves build_label through to_dict/from_dict (no disk)."""
+        profile = Profile(name="bl-test", cookies={"SID": "abc"}, build_label=_BUILD_LABEL)
+        assert Profile.from_dict(profile.to_dict()).build_label == _BUILD_LABEL
 
+    def test_profile_build_label_saved_to_disk(self):
+        """Profile save/load preserves build_label in metadata."""
         manager = AuthManager("bl-test")
         manager.save_profile(
             cookies={"SID": "abc"},
             csrf_token="csrf",
             email="test@gmail.com",
-            build_label="boq_labs-tailwind-frontend_20260219.16_p2",
+            build_label=_BUILD_LABEL,
         )
 
         manager._profile = None
         loaded = manager.load_profile()
-        assert loaded.build_label == "boq_labs-tailwind-frontend_20260219.16_p2"
+        assert loaded.build_label == _BUILD_LABEL
 
-    def test_profile_build_label_defaults_none_for_old_profiles(self, tmp_path, monkeypatch):
+    def test_profile_build_label_defaults_none_for_old_profiles(self, profiles_root):
         """Old profiles without build_label in metadata load with None."""
-        from notebooklm_tools.core.auth import AuthManager
-        import json
-
-        monkeypatch.setattr(
-            "notebooklm_tools.utils.config.get_profile_dir",
-            lambda name: tmp_path / name,
-        )
-
         # Simulate an old profile without build_label
-        profile_dir = tmp_path / "old-profile"
+        profile_dir = profiles_root / "old-profile"
         profile_dir.mkdir(parents=True)
-        (profile_dir / "cookies.json").write_text(json.dumps({"SID": "abc"}))
-        (profile_dir / "metadata.json").write_text(json.dumps({
-            "csrf_token": "csrf",
-            "session_id": "sid",
-            "email": "test@gmail.com",
-        }))
+        (profile_dir / "cookies.json").write_bytes(_OLD_PROFILE_COOKIES)
+        (profile_dir / "metadata.json").write_bytes(_OLD_PROFILE_METADATA)
 
         manager = AuthManager("old-profile")
         loaded = manager.load_profile()
@@ -1,145 +1,210 @@
 # tests/core/test_base.py
 """Tests for BaseClient infrastructure class."""
 
-from unittest.mock import patch, MagicMock
+import math
+from unittest.mock import MagicMock
+import httpx
 import pytest
 
+from notebooklm_tools.core.base import BaseClient
 
-def test_base_client_import():
-    """Test that BaseClient can be imported."""
-    from notebooklm_tools.core.base import BaseClient
-    assert BaseClient is not None
+# SID as _get_httpx_cookies should store it: on .google.com and duplicated to
+# .googleusercontent.com for artifact-download redirects.
+_EXPECTED_JAR = httpx.Cookies()
+_EXPECTED_JAR.set("SID", "abc123", domain=".google.com")
+_EXPECTED_JAR.set("SID", "abc123", domain=".googleusercontent.com")
+
+# A typical batchexecute response
+_RESP_TEXT = """)]}'
+42
+[["wrb.fr","testRpc","{\\"data\\":\\"value\\"}"]]
+"""
+
+
+def _jar_entries(cookies: httpx.Cookies) -> set[tuple[str, str, str, str]]:
+    """(domain, path, name, value) of every cookie in the jar."""
+    return {(c.domain, c.path, c.name, c.value) for c in cookies.jar}
+
+
+@pytest.fixture(autouse=True)
+def _no_refresh(monkeypatch):
+    """Keep BaseClient from fetching auth tokens over the network."""
+    monkeypatch.setattr(BaseClient, "_refresh_auth_tokens", lambda self: None)
+
+
+@pytest.fixture(scope="module")
+def base_client():
+    """A client shared by tests that only read from it (a CSRF token skips refresh)."""
+    return BaseClient(cookies={}, csrf_token="token", session_id="test_sid")
 
 
 def test_base_client_init():
     """Test BaseClient initialization with minimal args."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={"test": "cookie"})
-        assert client.cookies == {"test": "cookie"}
-        assert client._client is None
+    client = BaseClient(cookies={"test": "cookie"})
+    assert client.cookies == {"test": "cookie"}
+    assert client._client is None
 
 
-def test_base_client_init_with_csrf():
+def test_base_client_init_with_csrf(monkeypatch):
     """Test BaseClient initialization with CSRF token (skips refresh)."""
-    from notebooklm_tools.core.base import BaseClient
-    
     # When csrf_token is provided, _refresh_auth_tokens should NOT be called
-    with patch.object(BaseClient, '_refresh_auth_tokens') as mock_refresh:
-        client = BaseClient(cookies={"test": "cookie"}, csrf_token="test_token")
-        mock_refresh.assert_not_called()
-        assert client.csrf_token == "test_token"
+    calls = []
+    monkeypatch.setattr(BaseClient, "_refresh_auth_tokens", lambda self: calls.append(self))
+    client = BaseClient(cookies={"test": "cookie"}, csrf_token="test_token")
+    assert calls == []
+    assert client.csrf_token == "test_token"
 
 
-def test_build_request_body():
+def test_build_request_body(base_client):
     """Test building RPC request body."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={}, csrf_token="test_token")
-        body = client._build_request_body("testRpc", ["param1"])
-        assert "f.req=" in body
-        assert "at=" in body
-        assert "testRpc" in body
+    body = base_client._build_request_body("testRpc", ["param1"])
+    assert "f.req=" in body
+    assert "at=" in body
+    assert "testRpc" in body
 
 
-def test_build_url():
+def test_build_url(base_client):
     """Test building batchexecute URL."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={}, csrf_token="test_token", session_id="test_sid")
-        url = client._build_url("testRpc", "/notebook/123")
-        assert "rpcids=testRpc" in url
-        assert "source-path=" in url
-        assert "f.sid=test_sid" in url
+    url = base_client._build_url("testRpc", "/notebook/123")
+    assert "rpcids=testRpc" in url
+    assert "source-path=" in url
+    assert "f.sid=test_sid" in url
+
+
+def test_build_url_follows_env_changes(base_client, monkeypatch):
+    """Test that cached URLs still pick up a changed NOTEBOOKLM_HL."""
+    monkeypatch.delenv("NOTEBOOKLM_HL", raising=False)
+    assert "hl=en" in base_client._build_url("testRpc")
+    monkeypatch.setenv("NOTEBOOKLM_HL", "de")
+    assert "hl=de" in base_client._build_url("testRpc")
 
 
 def test_get_httpx_cookies_from_dict():
     """Test converting dict cookies to httpx.Cookies."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={"SID": "abc123"}, csrf_token="token")
-        cookies = client._get_httpx_cookies()
-        # Should have cookies for both domains
-        assert cookies.get("SID", domain=".google.com") == "abc123"
-        assert cookies.get("SID", domain=".googleusercontent.com") == "abc123"
+    client = BaseClient(cookies={"SID": "abc123"}, csrf_token="token")
+    cookies = client._get_httpx_cookies()
+    # Should have cookies for both domains
+    assert _jar_entries(cookies) == _jar_entries(_EXPECTED_JAR)
 
 
 def test_get_httpx_cookies_from_list():
     """Test converting list of cookie dicts to httpx.Cookies."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        cookie_list = [
-            {"name": "SID", "value": "abc123", "domain": ".google.com", "path": "/"}
-        ]
-        client = BaseClient(cookies=cookie_list, csrf_token="token")
-        cookies = client._get_httpx_cookies()
-        assert cookies.get("SID", domain=".google.com") == "abc123"
-        # Should also duplicate to googleusercontent.com
-        assert cookies.get("SID", domain=".googleusercontent.com") == "abc123"
-
-
-def test_parse_response():
+    cookie_list = [
+        {"name": "SID", "value": "abc123", "domain": ".google.com", "path": "/"}
+    ]
+    client = BaseClient(cookies=cookie_list, csrf_token="token")
+    cookies = client._get_httpx_cookies()
+    # Should also duplicate to googleusercontent.com
+    assert _jar_entries(cookies) == _jar_entries(_EXPECTED_JAR)
+
+
+def test_parse_response(base_client):
     """Test parsing batchexecute response."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={}, csrf_token="token")
-        
-        # Simulate a typical batchexecute response
-        response_text = """)]}'
-42
-[["wrb.fr","testRpc","{\\"data\\":\\"value\\"}"]]
-"""
-        result = client._parse_response(response_text)
-        assert len(result) == 1
-        assert result[0][0][0] == "wrb.fr"
-        assert result[0][0][1] == "testRpc"
+    result = base_client._parse_response(_RESP_TEXT)
+    assert len(result) == 1
+    assert result[0][0][0] == "wrb.fr"
+    assert result[0][0][1] == "testRpc"
 
 
-def test_extract_rpc_result():
+def test_parse_response_accepts_stdlib_only_json(base_client):
+    """Test that payloads orjson rejects (NaN) still parse like stdlib json."""
+    result = base_client._parse_response(")]}'\n10\n[1, NaN]\n")
+    assert result[0][0] == 1
+    assert math.isnan(result[0][1])
+
+
+def test_extract_rpc_result(base_client):
     """Test extracting RPC result from parsed response."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={}, csrf_token="token")
-        
-        parsed = [[["wrb.fr", "testRpc", '{"status": "ok"}']]]
-        result = client._extract_rpc_result(parsed, "testRpc")
-        assert result == {"status": "ok"}
+    parsed = [[["wrb.fr", "testRpc", '{"status": "ok"}']]]
+    result = base_client._extract_rpc_result(parsed, "testRpc")
+    assert result == {"status": "ok"}
 
 
 def test_context_manager():
     """Test BaseClient as context manager."""
-    from notebooklm_tools.core.base import BaseClient
-    
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        with BaseClient(cookies={}, csrf_token="token") as client:
-            assert client is not None
-        # After exiting, client should be closed
-        assert client._client is None
+    with BaseClient(cookies={}, csrf_token="token") as client:
+        assert client is not None
+    # After exiting, client should be closed
+    assert client._client is None
 
 
 def test_close():
     """Test explicit close."""
-    from notebooklm_tools.core.base import BaseClient
+    client = BaseClient(cookies={}, csrf_token="token")
+    # Create but don't use _client
+    client._client = MagicMock()
+    client.close()
+    assert client._client is None
+
+
+def test_get_client_reuses_pooled_client():
+    """Test that all RPCs share one keep-alive HTTP client until close()."""
+    client = BaseClient(cookies={}, csrf_token="token")
+    http_client = client._get_client()
+    assert client._get_client() is http_client
+    client.close()
+    assert http_client.is_closed
+
+
+def test_get_upload_client_reuses_pooled_client():
+    """Test that file uploads share one keep-alive HTTP client until close()."""
+    client = BaseClient(cookies={}, csrf_token="token")
+    upload_client = client._get_upload_client()
+    assert client._get_upload_client() is upload_client
+    client.close()
+    assert upload_client.is_closed
+    assert client._upload_client is None
+
+
+def test_replace_clients_keeps_old_client_open_until_close():
+    """Test that auth recovery leaves in-flight requests on the old client alone."""
+    client = BaseClient(cookies={}, csrf_token="token")
+    old_client = client._get_client()
+    client._replace_clients()
+    new_client = client._get_client()
+    assert new_client is not old_client
+    assert not old_client.is_closed
+    client.close()
+    assert old_client.is_closed
+    assert new_client.is_closed
+
+
+def test_replace_clients_keeps_one_retired_generation():
+    """Test that repeated auth recoveries close clients two generations old."""
+    client = BaseClient(cookies={}, csrf_token="token")
+    first = client._get_client()
+    client._replace_clients()
+    second = client._get_client()
+    client._replace_clients()
+    assert first.is_closed
+    assert not second.is_closed
+    assert client._retired_clients == [second]
+    client.close()
+
+
+def test_get_client_creates_one_client_across_threads():
+    """Test that concurrent lazy init does not build (and leak) extra clients."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    client = BaseClient(cookies={}, csrf_token="token")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(pool.map(lambda _: client._get_client(), range(32)))
+    assert all(c is clients[0] for c in clients)
+    client.close()
+
+
+def test_pool_covers_service_fan_outs():
+    """Test that the connection pool is large enough for threaded service calls."""
+    from notebooklm_tools.core.base import HTTP_POOL_LIMITS
+    from notebooklm_tools.core.sources import FRESHNESS_MAX_WORKERS
+    from notebooklm_tools.services.sources import SYNC_MAX_WORKERS
     
-    with patch.object(BaseClient, '_refresh_auth_tokens'):
-        client = BaseClient(cookies={}, csrf_token="token")
-        # Create but don't use _client
-        client._client = MagicMock()
-        client.close()
-        assert client._client is None
+    assert HTTP_POOL_LIMITS.max_connections >= max(FRESHNESS_MAX_WORKERS, SYNC_MAX_WORKERS, 10)
+    assert HTTP_POOL_LIMITS.max_keepalive_connections >= max(FRESHNESS_MAX_WORKERS, SYNC_MAX_WORKERS)
 
 
 def test_constants_available():
     """Test that RPC and API constants are available on BaseClient."""
-    from notebooklm_tools.core.base import BaseClient
-    
     # Check RPC IDs
     assert hasattr(BaseClient, 'RPC_LIST_NOTEBOOKS')
     assert hasattr(BaseClient, 'RPC_GET_NOTEBOOK')
@@ -157,49 +222,32 @@ def test_constants_available():
 class TestBuildLabelPriority:
     """Test build label (bl) resolution priority in _build_url()."""
 
-    def test_bl_uses_extracted_value(self):
-        """Extracted build label is used when no env var override."""
-        from notebooklm_tools.core.base import BaseClient
-
-        with patch.object(BaseClient, '_refresh_auth_tokens'):
-            client = BaseClient(
-                cookies={}, csrf_token="token",
-                build_label="boq_labs-tailwind-frontend_20260219.16_p2",
-            )
+    @pytest.mark.parametrize("build_label, env_bl, expected, excluded", [
+        # Extracted build label is used when no env var override
+        ("boq_labs-tailwind-frontend_20260219.16_p2", None,
+         "boq_labs-tailwind-frontend_20260219.16_p2", None),
+        # NOTEBOOKLM_BL env var takes precedence over extracted value
+        ("extracted_value", "env_override_value", "env_override_value", "extracted_value"),
+        # Falls back to hardcoded default when nothing else is available
+        ("", None, BaseClient._BL_FALLBACK, None),
+    ], ids=["extracted", "env-override", "fallback"])
+    def test_bl_priority(self, monkeypatch, build_label, env_bl, expected, excluded):
+        """_build_url picks the bl param: env var, then extracted label, then fallback."""
+        if env_bl is None:
+            monkeypatch.delenv("NOTEBOOKLM_BL", raising=False)
+        else:
+            monkeypatch.setenv("NOTEBOOKLM_BL", env_bl)
+
+        client = BaseClient(cookies={}, csrf_token="token", build_label=build_label)
         url = client._build_url("testRpc")
-        assert "boq_labs-tailwind-frontend_20260219.16_p2" in url
-
-    def test_bl_env_var_overrides_extracted(self):
-        """NOTEBOOKLM_BL env var takes precedence over extracted value."""
-        from notebooklm_tools.core.base import BaseClient
-        import os
-
-        with patch.object(BaseClient, '_refresh_auth_tokens'):
-            client = BaseClient(
-                cookies={}, csrf_token="token",
-                build_label="extracted_value",
-            )
-        with patch.dict(os.environ, {"NOTEBOOKLM_BL": "env_override_value"}):
-            url = client._build_url("testRpc")
-        assert "env_override_value" in url
-        assert "extracted_value" not in url
-
-    def test_bl_falls_back_to_hardcoded(self):
-        """Falls back to hardcoded default when nothing else is available."""
-        from notebooklm_tools.core.base import BaseClient
-
-        with patch.object(BaseClient, '_refresh_auth_tokens'):
-            client = BaseClient(cookies={}, csrf_token="token")
-        url = client._build_url("testRpc")
-        assert BaseClient._BL_FALLBACK in url
+        assert expected in url
+        if excluded is not None:
+            assert excluded not in url
 
     def test_bl_stored_on_init(self):
         """build_label parameter is stored as _bl on the client."""
-        from notebooklm_tools.core.base import BaseClient
-
-        with patch.object(BaseClient, '_refresh_auth_tokens'):
-            client = BaseClient(
-                cookies={}, csrf_token="token",
-                build_label="test_bl_value",
-            )
+        client = BaseClient(
+            cookies={}, csrf_token="token",
+            build_label="test_bl_value",
+        )
         assert client._bl == "test_bl_value"
@@ -23,6 +23,7 @@ def test_source_mixin_has_methods():
     
     expected_methods = [
         'check_source_freshness',
+        'check_sources_freshness_batch',
         'sync_drive_source',
         'delete_source',
         'get_notebook_sources_with_types',
@@ -98,3 +99,29 @@ def test_get_source_guide_uses_call_rpc():
             
             mock_rpc.assert_called_once()
             assert result == {"summary": "", "keywords": []}
+
+
+def test_check_sources_freshness_batch_maps_each_id():
+    """Test that batch freshness returns one entry per requested source."""
+    from notebooklm_tools.core.sources import SourceMixin
+
+    with patch.object(SourceMixin, '_refresh_auth_tokens'):
+        mixin = SourceMixin(cookies={"test": "cookie"}, csrf_token="test")
+    with patch.object(SourceMixin, 'check_source_freshness', side_effect=lambda sid: {"a": True, "b": False, "c": None}[sid]):
+        result = mixin.check_sources_freshness_batch(["a", "b", "c"])
+
+    assert result == {"a": True, "b": False, "c": None}
+
+
+def test_check_sources_freshness_batch_parallel_keeps_order():
+    """Test that larger batches fan out but still map results to their IDs."""
+    from notebooklm_tools.core.sources import SourceMixin
+
+    with patch.object(SourceMixin, '_refresh_auth_tokens'):
+        mixin = SourceMixin(cookies={"test": "cookie"}, csrf_token="test")
+    ids = [f"s{i}" for i in range(12)]
+    with patch.object(SourceMixin, 'check_source_freshness', side_effect=lambda sid: sid == "s3"):
+        result = mixin.check_sources_freshness_batch(ids)
+
+    assert list(result) == ids
+    assert [sid for sid, fresh in result.items() if fresh] == ["s3"]
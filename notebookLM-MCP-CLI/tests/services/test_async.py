@@ -0,0 +1,95 @@
+"""Tests for services._async module."""
+
+import pytest
+from unittest.mock import MagicMock
+from types import SimpleNamespace
+
+from notebooklm_tools.services import _async
+from notebooklm_tools.services.errors import ServiceError, NotFoundError, ValidationError
+
+
+@pytest.fixture
+def mock_client():
+    return MagicMock()
+
+
+class TestAsyncVariants:
+    """Test the awaitable service mirrors."""
+
+    @pytest.mark.asyncio
+    async def test_get_notebook(self, mock_client):
+        mock_client.get_notebook.return_value = SimpleNamespace(id="nb-1", title="T")
+
+        result = await _async.get_notebook(mock_client, "nb-1")
+
+        assert result["notebook_id"] == "nb-1"
+        assert result["title"] == "T"
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self, mock_client):
+        mock_client.list_notebooks.side_effect = RuntimeError("API error")
+        with pytest.raises(ServiceError, match="Failed to list notebooks"):
+            await _async.list_notebooks(mock_client)
+
+
+class TestGatherNotebooks:
+    """Test gather_notebooks fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, mock_client):
+        mock_client.get_notebook.side_effect = lambda nb_id: SimpleNamespace(id=nb_id)
+
+        results = await _async.gather_notebooks(mock_client, ["nb-1", "nb-2", "nb-3"])
+
+        assert [r["notebook_id"] for r in results] == ["nb-1", "nb-2", "nb-3"]
+
+    @pytest.mark.asyncio
+    async def test_failure_returned_in_place(self, mock_client):
+        mock_client.get_notebook.side_effect = (
+            lambda nb_id: None if nb_id == "nb-2" else SimpleNamespace(id=nb_id)
+        )
+
+        results = await _async.gather_notebooks(mock_client, ["nb-1", "nb-2"])
+
+        assert results[0]["notebook_id"] == "nb-1"
+        assert isinstance(results[1], NotFoundError)
+
+
+class TestSyncDriveSources:
+    """Test the async Drive sync fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, mock_client):
+        mock_client.sync_drive_source.side_effect = lambda sid: sid != "s2"
+
+        result = await _async.sync_drive_sources(mock_client, ["s1", "s2", "s3"])
+
+        assert [r["source_id"] for r in result["results"]] == ["s1", "s2", "s3"]
+        assert result["synced_count"] == 2
+        assert result["total_count"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded_per_source(self, mock_client):
+        def sync(sid):
+            if sid == "s1":
+                raise RuntimeError("boom")
+            return True
+        mock_client.sync_drive_source.side_effect = sync
+
+        result = await _async.sync_drive_sources(mock_client, ["s1", "s2"])
+
+        assert result["results"][0] == {"source_id": "s1", "synced": False, "error": "boom"}
+        assert result["synced_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_raises(self, mock_client):
+        with pytest.raises(ValidationError):
+            await _async.sync_drive_sources(mock_client, [])
+
+    @pytest.mark.asyncio
+    async def test_add_source_forwards_kwargs(self, mock_client):
+        mock_client.add_url_source.return_value = {"id": "src-1", "title": "Page"}
+
+        result = await _async.add_source(mock_client, "nb-1", "url", url="https://example.com")
+
+        assert result["source_id"] == "src-1"
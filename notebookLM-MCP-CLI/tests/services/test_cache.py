@@ -0,0 +1,74 @@
+"""Tests for services._cache module."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+
+from notebooklm_tools.services import _cache
+from notebooklm_tools.services.notebooks import get_notebook, rename_notebook
+from notebooklm_tools.services.errors import ServiceError
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock()
+    client.get_notebook.return_value = SimpleNamespace(id="nb-1", title="Cached")
+    return client
+
+
+class TestCachedRead:
+    """Test the TTL read cache around idempotent service calls."""
+
+    def test_repeat_read_hits_cache(self, mock_client):
+        first = get_notebook(mock_client, "nb-1")
+        second = get_notebook(mock_client, "nb-1")
+
+        assert first == second
+        mock_client.get_notebook.assert_called_once()
+
+    def test_keyword_call_shares_the_entry(self, mock_client):
+        get_notebook(mock_client, "nb-1")
+        get_notebook(client=mock_client, notebook_id="nb-1")
+
+        mock_client.get_notebook.assert_called_once()
+
+    def test_callers_get_independent_copies(self, mock_client):
+        get_notebook(mock_client, "nb-1")["status"] = "success"
+
+        assert "status" not in get_notebook(mock_client, "nb-1")
+
+    def test_clients_do_not_share_entries(self, mock_client):
+        other = MagicMock()
+        other.get_notebook.return_value = SimpleNamespace(id="nb-1", title="Other")
+
+        get_notebook(mock_client, "nb-1")
+
+        assert get_notebook(other, "nb-1")["title"] == "Other"
+
+    def test_expired_entry_refetched(self, mock_client):
+        get_notebook(mock_client, "nb-1")
+        with patch.object(_cache.time, "monotonic", return_value=1e12):
+            get_notebook(mock_client, "nb-1")
+
+        assert mock_client.get_notebook.call_count == 2
+
+    def test_errors_not_cached(self, mock_client):
+        mock_client.get_notebook.side_effect = [RuntimeError("fail"), SimpleNamespace(id="nb-1")]
+
+        with pytest.raises(ServiceError):
+            get_notebook(mock_client, "nb-1")
+        assert get_notebook(mock_client, "nb-1")["notebook_id"] == "nb-1"
+
+    def test_write_invalidates_notebook(self, mock_client):
+        get_notebook(mock_client, "nb-1")
+        rename_notebook(mock_client, "nb-1", "New")
+        get_notebook(mock_client, "nb-1")
+
+        assert mock_client.get_notebook.call_count == 2
+
+    def test_ttl_zero_disables_cache(self, mock_client):
+        with patch.object(_cache, "READ_CACHE_TTL", 0):
+            get_notebook(mock_client, "nb-1")
+            get_notebook(mock_client, "nb-1")
+
+        assert mock_client.get_notebook.call_count == 2
@@ -1,12 +1,16 @@
 """Tests for services.notebooks module."""
 
+import json
 import pytest
 from unittest.mock import MagicMock
 from types import SimpleNamespace
 
+from notebooklm_tools.utils._jsonio import dumps
 from notebooklm_tools.services.notebooks import (
+    NotebookInfo,
     list_notebooks,
     get_notebook,
+    list_notebooks_with_details,
     describe_notebook,
     create_notebook,
     rename_notebook,
@@ -60,6 +64,24 @@ class TestListNotebooks:
         assert result["shared_by_me_count"] == 1
         assert len(result["notebooks"]) == 3
 
+    def test_rows_are_plain_dicts(self, mock_client):
+        mock_client.list_notebooks.return_value = [_make_notebook(id="nb-1", title="A")]
+
+        row = list_notebooks(mock_client)["notebooks"][0]
+
+        assert type(row) is dict
+        assert list(row) == list(NotebookInfo.__annotations__)
+        assert json.loads(dumps(row)) == {
+            "id": "nb-1",
+            "title": "A",
+            "source_count": 3,
+            "url": "https://notebooklm.google.com/notebook/nb-1",
+            "ownership": "owned",
+            "is_shared": False,
+            "created_at": "2024-01-01",
+            "modified_at": "2024-01-02",
+        }
+
     def test_max_results_truncates(self, mock_client):
         mock_client.list_notebooks.return_value = [
             _make_notebook(id=f"nb-{i}") for i in range(10)
@@ -70,6 +92,20 @@ class TestListNotebooks:
         assert len(result["notebooks"]) == 3
         assert result["count"] == 10  # count reflects total, not truncated
 
+    def test_count_all_false_counts_returned_rows_only(self, mock_client):
+        mock_client.list_notebooks.return_value = [
+            _make_notebook(id="nb-1", is_owned=True),
+            _make_notebook(id="nb-2", is_owned=False),
+            _make_notebook(id="nb-3", is_owned=True),
+        ]
+
+        result = list_notebooks(mock_client, max_results=2, count_all=False)
+
+        assert result["count"] == 3
+        assert result["owned_count"] == 1
+        assert result["shared_count"] == 1
+        assert len(result["notebooks"]) == 2
+
     def test_empty_list(self, mock_client):
         mock_client.list_notebooks.return_value = []
 
@@ -116,6 +152,21 @@ class TestGetNotebook:
         assert result["notebook_id"] == "nb-42"
         assert result["title"] == "Fallback"
 
+    def test_cached_normalizer_reprobes_on_shape_change(self, mock_client):
+        mock_client.get_notebook.return_value = _make_notebook(id="nb-42")
+        assert get_notebook(mock_client, "nb-42")["notebook_id"] == "nb-42"
+
+        mock_client.get_notebook.return_value = [["Raw", [], "nb-7"]]
+        result = get_notebook(mock_client, "nb-7")
+
+        assert result["notebook_id"] == "nb-7"
+        assert result["title"] == "Raw"
+
+    def test_unknown_shape_raises_service_error(self, mock_client):
+        mock_client.get_notebook.return_value = ["too", "short"]
+        with pytest.raises(ServiceError, match="Unexpected notebook data format"):
+            get_notebook(mock_client, "nb-1")
+
     def test_none_raises_not_found(self, mock_client):
         mock_client.get_notebook.return_value = None
         with pytest.raises(NotFoundError, match="not found"):
@@ -127,6 +178,48 @@ class TestGetNotebook:
             get_notebook(mock_client, "nb-123")
 
 
+class TestListNotebooksWithDetails:
+    """Test list_notebooks_with_details service function."""
+
+    def test_details_returned_in_listing_order(self, mock_client):
+        mock_client.list_notebooks.return_value = [
+            _make_notebook(id=f"nb-{i}") for i in range(5)
+        ]
+        mock_client.get_notebook.side_effect = lambda nb_id: _make_notebook(id=nb_id)
+
+        result = list_notebooks_with_details(mock_client, workers=3)
+
+        assert result["count"] == 5
+        assert [nb["notebook_id"] for nb in result["notebooks"]] == [f"nb-{i}" for i in range(5)]
+        assert result["errors"] == []
+
+    def test_single_failure_does_not_abort_batch(self, mock_client):
+        mock_client.list_notebooks.return_value = [
+            _make_notebook(id="nb-1"),
+            _make_notebook(id="nb-2"),
+        ]
+
+        def get(nb_id):
+            if nb_id == "nb-2":
+                raise RuntimeError("fail")
+            return _make_notebook(id=nb_id)
+
+        mock_client.get_notebook.side_effect = get
+
+        result = list_notebooks_with_details(mock_client)
+
+        assert [nb["notebook_id"] for nb in result["notebooks"]] == ["nb-1"]
+        assert result["errors"][0]["notebook_id"] == "nb-2"
+
+    def test_empty_list(self, mock_client):
+        mock_client.list_notebooks.return_value = []
+
+        result = list_notebooks_with_details(mock_client)
+
+        assert result == {"notebooks": [], "errors": [], "count": 0}
+        mock_client.get_notebook.assert_not_called()
+
+
 class TestDescribeNotebook:
     """Test describe_notebook service function."""
 
@@ -1,11 +1,12 @@
 """Tests for services.research module."""
 
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from notebooklm_tools.services.research import (
     start_research,
     poll_research,
+    wait_for_research,
     import_research,
 )
 from notebooklm_tools.services.errors import ValidationError, ServiceError
@@ -125,6 +126,43 @@ class TestPollResearch:
             poll_research(mock_client, "nb-1")
 
 
+class TestWaitForResearch:
+    """Test wait_for_research backoff polling."""
+
+    def test_backs_off_until_completed(self, mock_client):
+        mock_client.poll_research.side_effect = [
+            {"status": "in_progress"},
+            {"status": "in_progress"},
+            {"status": "in_progress"},
+            {"status": "completed", "sources": [{"title": "A"}]},
+        ]
+
+        with patch("notebooklm_tools.services.research.time.sleep") as sleep, \
+                patch("notebooklm_tools.services.research.random.uniform", return_value=0):
+            result = wait_for_research(mock_client, "nb-1", "task-1", max_interval=3)
+
+        assert result["status"] == "completed"
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3]
+
+    def test_no_research_returns_immediately(self, mock_client):
+        mock_client.poll_research.return_value = None
+
+        with patch("notebooklm_tools.services.research.time.sleep") as sleep:
+            result = wait_for_research(mock_client, "nb-1")
+
+        assert result["status"] == "no_research"
+        sleep.assert_not_called()
+
+    def test_timeout_returns_last_status(self, mock_client):
+        mock_client.poll_research.return_value = {"status": "in_progress"}
+
+        with patch("notebooklm_tools.services.research.time.sleep") as sleep:
+            result = wait_for_research(mock_client, "nb-1", timeout=0)
+
+        assert result["status"] == "in_progress"
+        sleep.assert_not_called()
+
+
 class TestImportResearch:
     """Test import_research service function."""
 
@@ -154,6 +192,18 @@ class TestImportResearch:
         call_args = mock_client.import_research_sources.call_args
         assert call_args.kwargs["sources"] == [{"title": "B"}]
 
+    def test_duplicate_indices_imported_once_in_order(self, mock_client):
+        mock_client.poll_research.return_value = {
+            "status": "completed",
+            "sources": [{"title": "A"}, {"title": "B"}, {"title": "C"}],
+        }
+        mock_client.import_research_sources.return_value = [{"title": "A"}, {"title": "C"}]
+
+        import_research(mock_client, "nb-1", "task-1", source_indices=[2, 0, 2, -1, 5])
+
+        call_args = mock_client.import_research_sources.call_args
+        assert call_args.kwargs["sources"] == [{"title": "A"}, {"title": "C"}]
+
     def test_no_research_raises_service_error(self, mock_client):
         mock_client.poll_research.return_value = {"status": "no_research"}
         with pytest.raises(ServiceError, match="not found"):
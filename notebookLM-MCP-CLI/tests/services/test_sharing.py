@@ -145,6 +145,12 @@ class TestInviteCollaborator:
         with pytest.raises(ValidationError, match="Invalid role"):
             invite_collaborator(mock_client, "nb-123", "alice@example.com", "admin")
 
+    @pytest.mark.parametrize("email", ["", "alice", "alice@example", "a b@example.com", "a@@example.com"])
+    def test_invalid_email_raises_validation_error(self, mock_client, email):
+        with pytest.raises(ValidationError, match="Invalid email"):
+            invite_collaborator(mock_client, "nb-123", email, "viewer")
+        mock_client.add_collaborator.assert_not_called()
+
     def test_role_case_insensitive(self, mock_client):
         mock_client.add_collaborator.return_value = True
 
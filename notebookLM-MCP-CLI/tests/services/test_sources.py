@@ -9,6 +9,7 @@ from notebooklm_tools.services.sources import (
     add_source,
     list_drive_sources,
     sync_drive_sources,
+    rename_source,
     delete_source,
     describe_source,
     get_source_content,
@@ -31,6 +32,9 @@ def mock_client():
         {"id": "s2", "title": "Source 2", "source_type_name": "Drive", "can_sync": True, "drive_doc_id": "d1"},
     ]
     client.check_source_freshness.return_value = True
+    client.check_sources_freshness_batch.side_effect = (
+        lambda ids: {sid: client.check_source_freshness(sid) for sid in ids}
+    )
     # Sync/delete/describe/content
     client.sync_drive_source.return_value = True
     client.delete_source.return_value = True
@@ -46,7 +50,7 @@ def mock_client():
 class TestValidateSourceType:
     """Test validate_source_type function."""
 
-    @pytest.mark.parametrize("source_type", VALID_SOURCE_TYPES)
+    @pytest.mark.parametrize("source_type", sorted(VALID_SOURCE_TYPES))
     def test_valid_types_pass(self, source_type):
         validate_source_type(source_type)  # should not raise
 
@@ -151,6 +155,7 @@ class TestListDriveSources:
 
     def test_returns_categorized_sources(self, mock_client):
         result = list_drive_sources(mock_client, "nb-1")
+        assert result["notebook_id"] == "nb-1"
         assert result["drive_count"] == 1
         assert len(result["other_sources"]) == 1
         assert result["drive_sources"][0]["id"] == "s2"
@@ -166,6 +171,15 @@ class TestListDriveSources:
         assert result["stale_count"] == 0
         assert result["drive_sources"][0]["stale"] is False
 
+    def test_result_rows_are_plain_dicts(self, mock_client):
+        result = list_drive_sources(mock_client, "nb-1")
+        assert set(result["drive_sources"][0]) == {"id", "title", "type", "stale", "drive_doc_id"}
+        assert set(result["other_sources"][0]) == {"id", "title", "type"}
+
+    def test_freshness_fetched_in_one_batch(self, mock_client):
+        list_drive_sources(mock_client, "nb-1")
+        mock_client.check_sources_freshness_batch.assert_called_once_with(["s2"])
+
     def test_api_error(self, mock_client):
         mock_client.get_notebook_sources_with_types.side_effect = RuntimeError("fail")
         with pytest.raises(ServiceError, match="Failed to list"):
@@ -176,16 +190,30 @@ class TestSyncDriveSources:
     """Test sync_drive_sources function."""
 
     def test_sync_success(self, mock_client):
-        results = sync_drive_sources(mock_client, ["s1", "s2"])
-        assert len(results) == 2
-        assert all(r["synced"] for r in results)
+        result = sync_drive_sources(mock_client, ["s1", "s2"])
+        assert len(result["results"]) == 2
+        assert all(r["synced"] for r in result["results"])
+        assert result["synced_count"] == 2
+        assert result["total_count"] == 2
 
     def test_sync_partial_failure(self, mock_client):
-        mock_client.sync_drive_source.side_effect = [True, RuntimeError("fail")]
-        results = sync_drive_sources(mock_client, ["s1", "s2"])
+        def sync(source_id):
+            if source_id == "s2":
+                raise RuntimeError("fail")
+            return True
+
+        mock_client.sync_drive_source.side_effect = sync
+        result = sync_drive_sources(mock_client, ["s1", "s2"])
+        results = result["results"]
         assert results[0]["synced"] is True
         assert results[1]["synced"] is False
         assert results[1]["error"] == "fail"
+        assert result["synced_count"] == 1
+
+    def test_results_keep_input_order(self, mock_client):
+        ids = [f"s{i}" for i in range(20)]
+        result = sync_drive_sources(mock_client, ids)
+        assert [r["source_id"] for r in result["results"]] == ids
 
     def test_empty_list_raises(self, mock_client):
         with pytest.raises(ValidationError, match="No source IDs"):
@@ -206,8 +234,26 @@ class TestDeleteSource:
 
     def test_api_error(self, mock_client):
         mock_client.delete_source.side_effect = RuntimeError("fail")
-        with pytest.raises(ServiceError, match="Failed to delete"):
+        with pytest.raises(ServiceError, match="Failed to delete source src-1: fail") as exc:
             delete_source(mock_client, "src-1")
+        assert exc.value.user_message == "Failed to delete source."
+        assert isinstance(exc.value.__cause__, RuntimeError)
+
+
+class TestRenameSource:
+    """Test rename_source function."""
+
+    def test_title_is_stripped(self, mock_client):
+        mock_client.rename_source.return_value = {"id": "src-1", "title": "New"}
+        result = rename_source(mock_client, "nb-1", "src-1", "  New  ")
+        mock_client.rename_source.assert_called_once_with("nb-1", "src-1", "New")
+        assert result == {"source_id": "src-1", "title": "New"}
+
+    @pytest.mark.parametrize("title", ["", "   ", None])
+    def test_empty_title_raises(self, mock_client, title):
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            rename_source(mock_client, "nb-1", "src-1", title)
+        mock_client.rename_source.assert_not_called()
 
 
 class TestDescribeSource:
@@ -234,6 +280,10 @@ class TestGetSourceContent:
         assert result["source_type"] == "url"
         assert result["char_count"] == 11
 
+    def test_uses_reported_char_count(self, mock_client):
+        mock_client.get_source_fulltext.return_value = {"content": "Hello world", "char_count": 42}
+        assert get_source_content(mock_client, "src-1")["char_count"] == 42
+
     def test_empty_result_raises(self, mock_client):
         mock_client.get_source_fulltext.return_value = None
         with pytest.raises(ServiceError, match="No content returned"):
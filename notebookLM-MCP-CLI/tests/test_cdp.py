@@ -0,0 +1,428 @@
+"""Tests for the CDP WebSocket helpers in utils/cdp.py."""
+
+import json
+import threading
+
+import pytest
+
+from notebooklm_tools.utils import cdp
+
+
+class FakeWebSocket:
+    """Minimal stand-in for a websocket-client connection to one page.
+
+    Replies to each sent command with a result produced by ``handlers``;
+    replies are queued until recv() so batched sends can be observed.
+    ``later`` frames are delivered once every queued reply has been read.
+    """
+
+    def __init__(self, handlers):
+        self.handlers = handlers
+        self.sent = []
+        self.inbox = []
+        self.later = []
+        self.timeout = None
+        self.closed = False
+
+    def send(self, payload):
+        command = json.loads(payload)
+        self.sent.append(command)
+        result = self.handlers[command["method"]](command.get("params", {}))
+        self.inbox.append(json.dumps({"id": command["id"], "result": result}))
+
+    def recv(self):
+        if not self.inbox and self.later:
+            self.inbox.append(self.later.pop(0))
+        if not self.inbox:
+            raise cdp.websocket.WebSocketTimeoutException("no frames")
+        return self.inbox.pop(0)
+
+    def recv_data(self):
+        return 1, self.recv().encode()
+
+    def settimeout(self, timeout):
+        self.timeout = timeout
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    """Route cdp's WebSocket connections to a FakeWebSocket."""
+    ws = FakeWebSocket({
+        "Runtime.enable": lambda params: {},
+        "Network.getAllCookies": lambda params: {"cookies": [{"name": "SID", "value": "abc"}]},
+        "Runtime.evaluate": lambda params: {"result": {"value": "<html>page</html>"}},
+    })
+    monkeypatch.setattr(cdp, "_cached_ws", None)
+    monkeypatch.setattr(cdp, "_cached_ws_url", None)
+    monkeypatch.setattr(cdp, "_enabled_domains", {})
+    monkeypatch.setattr(cdp, "_pending_events", {})
+    monkeypatch.setattr(cdp.websocket, "create_connection", lambda *args, **kwargs: ws)
+    return ws
+
+
+class TestExecuteCdpBatch:
+    """Test batched CDP command execution."""
+
+    def test_results_in_command_order(self, fake_ws):
+        results = cdp.execute_cdp_batch("ws://page", [
+            ("Network.getAllCookies", None),
+            ("Runtime.evaluate", {"expression": "1"}),
+        ])
+        assert results[0]["cookies"][0]["name"] == "SID"
+        assert results[1]["result"]["value"] == "<html>page</html>"
+
+    def test_sends_all_before_reading(self, fake_ws):
+        cdp.execute_cdp_batch("ws://page", [("Runtime.enable", None), ("Network.getAllCookies", None)])
+        assert [c["method"] for c in fake_ws.sent] == ["Runtime.enable", "Network.getAllCookies"]
+        assert len({c["id"] for c in fake_ws.sent}) == 2
+
+    def test_buffers_event_frames(self, fake_ws):
+        event = {"method": "Page.frameNavigated", "params": {}}
+        fake_ws.inbox.append(json.dumps(event))
+        assert cdp.execute_cdp_command("ws://page", "Runtime.enable") == {}
+        assert list(cdp._pending_events["ws://page"]) == [event]
+
+    def test_command_ids_are_unique(self, fake_ws):
+        cdp.execute_cdp_command("ws://page", "Runtime.enable")
+        cdp.execute_cdp_command("ws://page", "Runtime.enable")
+        assert fake_ws.sent[0]["id"] != fake_ws.sent[1]["id"]
+
+    def test_retries_once_on_a_stale_connection(self, fake_ws, monkeypatch):
+        send = fake_ws.send
+        failures = [BrokenPipeError()]
+
+        def flaky_send(payload):
+            if failures:
+                raise failures.pop()
+            send(payload)
+
+        monkeypatch.setattr(fake_ws, "send", flaky_send)
+        assert cdp.execute_cdp_command("ws://page", "Runtime.enable") == {}
+        assert fake_ws.closed  # the stale socket is closed, not just dropped
+
+    def test_second_failure_is_raised(self, fake_ws, monkeypatch):
+        def broken_send(payload):
+            raise BrokenPipeError()
+
+        monkeypatch.setattr(fake_ws, "send", broken_send)
+        with pytest.raises(BrokenPipeError):
+            cdp.execute_cdp_command("ws://page", "Runtime.enable")
+
+    def test_sets_command_timeout(self, fake_ws):
+        fake_ws.timeout = 30
+        cdp.execute_cdp_command("ws://page", "Runtime.enable")
+        assert fake_ws.timeout == cdp._CDP_COMMAND_TIMEOUT
+
+    def test_cookies_and_html_in_one_batch(self, fake_ws):
+        cookies, html = cdp.get_page_cookies_and_html("ws://page")
+        assert cookies == [{"name": "SID", "value": "abc"}]
+        assert html == "<html>page</html>"
+
+
+class TestPageHelpers:
+    """Test the page-level CDP helpers."""
+
+    def test_runtime_enabled_once_per_connection(self, fake_ws):
+        cdp.get_current_url("ws://page")
+        cdp.get_current_url("ws://page")
+        methods = [c["method"] for c in fake_ws.sent]
+        assert methods.count("Runtime.enable") == 1
+
+    def test_domains_reenabled_after_reconnect(self, fake_ws, monkeypatch):
+        cdp.get_current_url("ws://page")
+        monkeypatch.setattr(cdp, "_cached_ws", None)  # Connection dropped
+        cdp.get_current_url("ws://page")
+        methods = [c["method"] for c in fake_ws.sent]
+        assert methods.count("Runtime.enable") == 2
+
+    def test_get_page_html_reads_dom(self, fake_ws):
+        fake_ws.handlers["DOM.getDocument"] = lambda params: {"root": {"nodeId": 7}}
+        fake_ws.handlers["DOM.getOuterHTML"] = lambda params: {"outerHTML": f"<html>{params['nodeId']}</html>"}
+        assert cdp.get_page_html("ws://page") == "<html>7</html>"
+        assert "Runtime.evaluate" not in [c["method"] for c in fake_ws.sent]
+
+    def test_get_url_and_html(self, fake_ws):
+        fake_ws.handlers["Runtime.evaluate"] = lambda params: {
+            "result": {"value": json.dumps({"u": "https://notebooklm.google.com/", "h": "<html/>"})},
+        }
+        assert cdp.get_url_and_html("ws://page") == ("https://notebooklm.google.com/", "<html/>")
+
+
+class TestExtractAll:
+    """Test extracting every page token from one HTML document."""
+
+    def test_extracts_all_tokens(self):
+        html = (
+            '"cfb2h":"boq_labs_1","SNlM0e":"csrf-tok","FdrFJe":"123",'
+            '"x@google.com","user@example.com"'
+        )
+        assert cdp.extract_all(html) == {
+            "csrf_token": "csrf-tok",
+            "session_id": "123",
+            "email": "user@example.com",
+            "build_label": "boq_labs_1",
+        }
+
+    def test_missing_tokens_are_empty(self):
+        assert set(cdp.extract_all("<html></html>").values()) == {""}
+
+
+class TestFindExistingChrome:
+    """Test the DevTools port scan."""
+
+    @pytest.fixture
+    def ports_in_use(self, monkeypatch, tmp_path):
+        """Make connect() succeed (something listening) for the ports in the returned set."""
+        listening = set()
+        monkeypatch.setattr(cdp, "get_chrome_profile_dir", lambda name: tmp_path)
+
+        class FakeSocket:
+            def __init__(self, *args):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def settimeout(self, timeout):
+                pass
+
+            def connect_ex(self, address):
+                return 0 if address[1] in listening else 111
+
+        monkeypatch.setattr(cdp.socket, "socket", FakeSocket)
+        return listening
+
+    def test_returns_chrome_port(self, ports_in_use, monkeypatch):
+        ports_in_use.update({9223, 9225})
+        monkeypatch.setattr(
+            cdp, "get_debugger_url",
+            lambda port, timeout=5: "ws://chrome" if port == 9225 else None,
+        )
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9225, "ws://chrome")
+
+    def test_known_port_checked_alone_first(self, ports_in_use, monkeypatch):
+        ports_in_use.update({9222, 9224})
+        probed = []
+
+        def get_debugger_url(port, timeout=5):
+            probed.append(port)
+            return "ws://chrome"
+
+        monkeypatch.setattr(cdp, "_chrome_port", 9224)
+        monkeypatch.setattr(cdp, "get_debugger_url", get_debugger_url)
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9224, "ws://chrome")
+        assert probed == [9224]
+
+    def test_free_ports_are_not_probed(self, ports_in_use, monkeypatch):
+        probed = []
+        monkeypatch.setattr(cdp, "get_debugger_url", lambda port, timeout=5: probed.append(port))
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (None, None)
+        assert probed == []
+
+    def test_saved_port_tried_before_scan(self, ports_in_use, monkeypatch):
+        cdp._save_last_port("default", 9225)
+        probed = []
+
+        def get_debugger_url(port, timeout=5):
+            probed.append(port)
+            return "ws://chrome"
+
+        monkeypatch.setattr(cdp, "get_debugger_url", get_debugger_url)
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9225, "ws://chrome")
+        assert probed == [9225]
+
+    def test_stale_saved_port_falls_back_to_scan(self, ports_in_use, monkeypatch):
+        cdp._save_last_port("default", 9225)
+        ports_in_use.add(9223)
+        monkeypatch.setattr(
+            cdp, "get_debugger_url",
+            lambda port, timeout=5: "ws://chrome" if port == 9223 else None,
+        )
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9223, "ws://chrome")
+
+    def test_several_endpoints_prefer_default_then_lowest(self, ports_in_use, monkeypatch):
+        ports_in_use.update({9223, 9225, 9226})
+        monkeypatch.setattr(cdp, "get_debugger_url", lambda port, timeout=5: f"ws://{port}")
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9223, "ws://9223")
+        ports_in_use.add(9222)
+        assert cdp.find_existing_nlm_chrome(range(9222, 9227)) == (9222, "ws://9222")
+
+
+class TestFindOrCreatePage:
+    """Test locating the NotebookLM tab on a CDP endpoint."""
+
+    @pytest.fixture
+    def http(self, monkeypatch):
+        """Serve ``pages`` from GET /json and record PUT /json/new calls."""
+
+        class FakeHttp:
+            pages = b"[]"
+            created = []
+
+            def get(self, url, timeout=None):
+                return type("Response", (), {"content": self.pages})()
+
+            def put(self, url, timeout=None):
+                self.created.append(url)
+                page = {"id": "new", "url": "https://notebooklm.google.com/"}
+                return type("Response", (), {
+                    "status_code": 200, "text": json.dumps(page), "json": lambda self: page,
+                })()
+
+        fake = FakeHttp()
+        monkeypatch.setattr(cdp, "httpx_client", fake)
+        return fake
+
+    def test_returns_existing_notebooklm_tab(self, http):
+        http.pages = json.dumps([
+            {"id": "a", "url": "https://example.com/"},
+            {"id": "b", "url": "https://notebooklm.google.com/notebook/1"},
+        ]).encode()
+        assert cdp.find_or_create_notebooklm_page_by_cdp_url("http://cdp")["id"] == "b"
+        assert http.created == []
+
+    def test_creates_tab_when_host_not_in_targets(self, http):
+        http.pages = json.dumps([{"id": "a", "url": "https://example.com/"}]).encode()
+        assert cdp.find_or_create_notebooklm_page_by_cdp_url("http://cdp")["id"] == "new"
+
+    def test_host_outside_url_field_still_creates(self, http):
+        http.pages = json.dumps([
+            {"id": "a", "title": "notebooklm.google.com", "url": "https://example.com/"},
+        ]).encode()
+        assert cdp.find_or_create_notebooklm_page_by_cdp_url("http://cdp")["id"] == "new"
+
+
+class TestWaitForLoggedInUrl:
+    """Test the event-driven login wait."""
+
+    @pytest.fixture
+    def login_ws(self, fake_ws):
+        fake_ws.handlers["Page.enable"] = lambda params: {}
+        fake_ws.handlers["Runtime.evaluate"] = lambda params: {
+            "result": {"value": "https://accounts.google.com/signin"},
+        }
+        return fake_ws
+
+    def test_returns_on_main_frame_navigation(self, login_ws):
+        login_ws.later.extend([
+            json.dumps({"method": "Page.frameNavigated", "params": {
+                "frame": {"id": "child", "parentId": "main", "url": "https://notebooklm.google.com/iframe"},
+            }}),
+            json.dumps({"method": "Page.frameNavigated", "params": {
+                "frame": {"id": "main", "url": "https://notebooklm.google.com/"},
+            }}),
+        ])
+        assert cdp.wait_for_logged_in_url("ws://page", 5) == "https://notebooklm.google.com/"
+
+    def test_sees_navigation_buffered_during_url_check(self, login_ws):
+        # The event arrives before the reply to the initial URL check
+        original_send = login_ws.send
+
+        def send(payload):
+            if json.loads(payload)["method"] == "Runtime.evaluate":
+                login_ws.inbox.append(json.dumps({"method": "Page.frameNavigated", "params": {
+                    "frame": {"id": "main", "url": "https://notebooklm.google.com/"},
+                }}))
+            original_send(payload)
+
+        login_ws.send = send
+        assert cdp.wait_for_logged_in_url("ws://page", 5) == "https://notebooklm.google.com/"
+
+    def test_timeout_returns_last_url(self, login_ws):
+        assert cdp.wait_for_logged_in_url("ws://page", 0) == "https://accounts.google.com/signin"
+
+    def test_other_callers_get_the_connection_during_the_wait(self, login_ws):
+        # Login only completes once another thread, started mid-wait, has
+        # taken the CDP lock
+        def other_caller():
+            with cdp._ws_lock:
+                login_ws.later.append(json.dumps({"method": "Page.frameNavigated", "params": {
+                    "frame": {"id": "main", "url": "https://notebooklm.google.com/"},
+                }}))
+
+        thread = threading.Thread(target=other_caller)
+        original_recv = login_ws.recv
+
+        def recv():
+            if not login_ws.inbox and thread.ident is None:
+                thread.start()
+            return original_recv()
+
+        login_ws.recv = recv
+        try:
+            assert cdp.wait_for_logged_in_url("ws://page", 2) == "https://notebooklm.google.com/"
+        finally:
+            thread.join()
+
+
+class TestCleanupChromeProfileCache:
+    """Test removal of Chrome cache directories."""
+
+    def test_removes_caches_and_reports_bytes(self, tmp_path, monkeypatch):
+        default_dir = tmp_path / "Default"
+        (default_dir / "Cache" / "sub").mkdir(parents=True)
+        (default_dir / "Cache" / "a.bin").write_bytes(b"x" * 100)
+        (default_dir / "Cache" / "sub" / "b.bin").write_bytes(b"x" * 50)
+        (default_dir / "Cookies").write_bytes(b"keep")
+        monkeypatch.setattr(cdp, "get_chrome_profile_dir", lambda name: tmp_path)
+
+        assert cdp.cleanup_chrome_profile_cache() == 150
+        assert not (default_dir / "Cache").exists()
+        assert (default_dir / "Cookies").exists()
+
+
+class TestExtractCookiesViaCdpCache:
+    """Test the short-lived cache of CDP auth results."""
+
+    @pytest.fixture
+    def extraction(self, monkeypatch, tmp_path):
+        calls = []
+        monkeypatch.setattr(cdp, "_RESULT_CACHE", {})
+        monkeypatch.setattr(cdp, "get_chrome_profile_dir", lambda name: tmp_path / name)
+        monkeypatch.setattr(
+            cdp, "find_existing_nlm_chrome", lambda profile_name="default": (9222, "ws://browser"),
+        )
+        monkeypatch.setattr(
+            cdp, "extract_cookies_from_page",
+            lambda *args: calls.append(args) or {"cookies": [{"name": "SID", "value": "abc"}]},
+        )
+        return calls
+
+    def test_repeat_call_is_served_from_cache(self, extraction):
+        first = cdp.extract_cookies_via_cdp(port=9222)
+        first["cookies"].clear()  # Callers get copies
+        second = cdp.extract_cookies_via_cdp(port=9222)
+        assert len(extraction) == 1
+        assert second["cookies"] == [{"name": "SID", "value": "abc"}]
+
+    def test_clear_profile_bypasses_cache(self, extraction, monkeypatch):
+        cdp.extract_cookies_via_cdp(port=9222)
+        monkeypatch.setattr(cdp, "find_available_port", lambda: 9222)
+        monkeypatch.setattr(cdp, "get_chrome_path", lambda: "chrome")
+        monkeypatch.setattr(cdp, "launch_chrome", lambda *args, **kwargs: True)
+        monkeypatch.setattr(cdp, "get_debugger_url", lambda *args, **kwargs: "ws://browser")
+        cdp.extract_cookies_via_cdp(port=9222, clear_profile=True)
+        assert len(extraction) == 2
+
+
+class TestTerminateChrome:
+    """Test shutting down a launched Chrome process."""
+
+    def test_returns_once_process_exits(self, monkeypatch):
+        import subprocess
+        import sys
+        import time
+
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(0.1)"])
+        monkeypatch.setattr(cdp, "_cached_ws_url", None)
+
+        start = time.monotonic()
+        assert cdp.terminate_chrome(process) is True
+        assert process.poll() is not None
+        assert time.monotonic() - start < 4
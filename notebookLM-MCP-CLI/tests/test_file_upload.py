@@ -1,5 +1,6 @@
 """Tests for file upload functionality."""
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
@@ -22,6 +23,8 @@ class TestFileValidation:
         client.csrf_token = "test"
         client._session_id = "test"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         with pytest.raises(FileValidationError, match="File not found"):
             client.add_file("test-notebook-id", "/nonexistent/file.pdf")
@@ -35,6 +38,8 @@ class TestFileValidation:
         client.csrf_token = "test"
         client._session_id = "test"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
             temp_path = f.name
@@ -54,6 +59,8 @@ class TestFileValidation:
         client.csrf_token = "test"
         client._session_id = "test"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         with tempfile.TemporaryDirectory() as tmpdir:
             with pytest.raises(FileValidationError, match="Not a regular file"):
@@ -68,6 +75,8 @@ class TestFileValidation:
         client.csrf_token = "test"
         client._session_id = "test"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         # Create a JSON file (unsupported type)
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
@@ -93,6 +102,8 @@ class TestFileUploadProtocol:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         # Mock the HTTP client and response
         mock_response = Mock()
@@ -118,6 +129,8 @@ class TestFileUploadProtocol:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         # Mock response with no source ID
         mock_response = Mock()
@@ -141,6 +154,8 @@ class TestFileUploadProtocol:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
         client.UPLOAD_URL = "https://notebooklm.google.com/upload/_/"
 
         # Mock response with upload URL
@@ -172,6 +187,8 @@ class TestFileUploadProtocol:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
         client.UPLOAD_URL = "https://notebooklm.google.com/upload/_/"
 
         # Mock response without upload URL
@@ -202,6 +219,8 @@ class TestFileUploadProtocol:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         # Create a temporary test file
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
@@ -242,6 +261,8 @@ class TestAddFileIntegration:
         client.csrf_token = "test-csrf"
         client._session_id = "test-session"
         client._client = None
+        client._upload_client = None
+        client._client_lock = threading.Lock()
 
         # Create a test file
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
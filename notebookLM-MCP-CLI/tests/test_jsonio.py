@@ -0,0 +1,70 @@
+"""Tests for utils._jsonio module."""
+
+import datetime
+import json
+
+import pytest
+
+from notebooklm_tools.utils import _jsonio
+from notebooklm_tools.utils._jsonio import dumps, loads, to_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_jsonio, "orjson", None)
+    return request.param
+
+
+class TestToJson:
+    """Test JSON serialization of service results."""
+
+    def test_round_trips_result_dict(self, backend):
+        result = {"notebooks": [{"id": "nb-1", "title": "Café"}], "count": 1}
+        assert json.loads(to_json(result)) == result
+
+    def test_compact_output_matches_across_backends(self, backend):
+        result = {"notebooks": [{"id": "nb-1", "title": "Café"}], "count": 1, "ok": None}
+        assert dumps(result) == '{"notebooks":[{"id":"nb-1","title":"Café"}],"count":1,"ok":null}'
+
+    def test_indent_and_str_output(self, backend):
+        out = dumps({"a": 1}, indent=True)
+        assert isinstance(out, str)
+        assert out == '{\n  "a": 1\n}'
+
+    def test_non_native_values_fall_back_to_str(self, backend):
+        out = json.loads(dumps({"when": object.__new__(_Unserializable)}))
+        assert out == {"when": "unserializable"}
+
+    def test_int_keys_become_strings(self, backend):
+        assert json.loads(dumps({1: "a"})) == {"1": "a"}
+
+    def test_datetime_format_depends_on_backend(self, backend):
+        expected = {"orjson": "2024-01-01T12:00:00", "stdlib": "2024-01-01 12:00:00"}
+        when = datetime.datetime(2024, 1, 1, 12, 0)
+        assert json.loads(dumps({"when": when})) == {"when": expected[backend]}
+
+
+class TestLoads:
+    """Test JSON parsing."""
+
+    def test_parses_text_and_bytes(self, backend):
+        assert loads('{"a": [1, "é"]}') == {"a": [1, "é"]}
+        assert loads('{"a": [1, "é"]}'.encode()) == {"a": [1, "é"]}
+
+    def test_accepts_stdlib_only_json(self, backend):
+        result = loads("[1, NaN]")
+        assert result[0] == 1
+        assert result[1] != result[1]
+
+    def test_invalid_json_raises_stdlib_error(self, backend):
+        with pytest.raises(json.JSONDecodeError):
+            loads("{not json")
+
+
+class _Unserializable:
+    def __str__(self):
+        return "unserializable"